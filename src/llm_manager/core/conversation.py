@@ -1,15 +1,105 @@
 """Conversation history management."""
 
+import atexit
 import json
-from dataclasses import dataclass, asdict
+import os
+import queue
+import threading
+import weakref
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import islice
+from time import time
 from pathlib import Path
-from typing import List, Optional
+from typing import Deque, List, Optional
 
 from .settings import settings
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
-@dataclass
+
+def _dumps(data) -> bytes:
+    """Serialize data to indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _dumps_line(data) -> bytes:
+    """Serialize data to a single newline-terminated line of compact JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def _loads(raw: bytes):
+    """Deserialize UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# The background writer waits this many seconds for more turns before writing...
+FLUSH_INTERVAL = 0.1
+# ...or writes once this many turns are waiting, whichever comes first
+FLUSH_BATCH_SIZE = 10
+
+# Turn timestamps are reformatted at most this often; rapid turns share one
+TIMESTAMP_RESOLUTION = 0.5
+
+# Live histories, so turns still buffered at interpreter exit are written
+_open_histories: "weakref.WeakSet[ConversationHistory]" = weakref.WeakSet()
+
+# One entry per added turn, naming the history that has it to write
+_write_queue: "queue.Queue[ConversationHistory]" = queue.Queue()
+_writer_thread: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+
+
+@atexit.register
+def _flush_open_histories() -> None:
+    """Write any buffered turns of histories still alive at exit."""
+    for history in list(_open_histories):
+        history.flush()
+
+
+def _start_writer() -> None:
+    """Start the background history writer, once per process."""
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(
+                target=_writer_loop, name="history-writer", daemon=True
+            )
+            _writer_thread.start()
+
+
+def _writer_loop() -> None:
+    """Write queued turns, coalescing each burst into one write per history."""
+    while True:
+        histories = {_write_queue.get()}
+        count = 1
+        while count < FLUSH_BATCH_SIZE:
+            try:
+                histories.add(_write_queue.get(timeout=FLUSH_INTERVAL))
+            except queue.Empty:
+                break
+            count += 1
+
+        for history in histories:
+            try:
+                history.flush()
+            except Exception as e:
+                print(f"Error saving history: {e}")
+        for _ in range(count):
+            _write_queue.task_done()
+
+
+@dataclass(slots=True)
 class ConversationTurn:
     """A single turn in a conversation."""
 
@@ -22,26 +112,58 @@ class ConversationTurn:
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
-        return asdict(self)
+        # Flat record of strings, so no need for asdict's recursive deep copy
+        return {
+            "timestamp": self.timestamp,
+            "model": self.model,
+            "user_prompt": self.user_prompt,
+            "system_prompt": self.system_prompt,
+            "context": self.context,
+            "response": self.response,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "ConversationTurn":
-        """Create from dictionary."""
-        return cls(**data)
+        """Create from dictionary; missing fields default to empty strings."""
+        get = data.get
+        return cls(
+            get("timestamp", ""),
+            get("model", ""),
+            get("user_prompt", ""),
+            get("system_prompt", ""),
+            get("context", ""),
+            get("response", ""),
+        )
 
 
 class ConversationHistory:
     """Manages conversation history."""
 
-    def __init__(self, history_file: Optional[Path] = None):
+    def __init__(self, history_file: Optional[Path] = None, autosave: bool = True):
         """Initialize conversation history.
 
         Args:
             history_file: Path to history file (uses default if not specified)
+            autosave: Write added turns in the background; when False, turns
+                are only written by flush()
         """
         self.history_file = history_file or settings.CONVERSATION_HISTORY_FILE
-        self.turns: List[ConversationTurn] = []
+        self.autosave = autosave
+        # Ring buffer: appending past the limit evicts the oldest turn
+        self.turns: Deque[ConversationTurn] = deque(maxlen=settings.MAX_HISTORY_ITEMS)
+        # Guards turns and the pending count; only held briefly, never during I/O
+        self._lock = threading.Lock()
+        # Serializes writes and guards the file state below
+        self._write_lock = threading.Lock()
+        self._pending = 0  # Turns added since the last write
+        self._file_lines = 0  # Turn lines currently in the history file
+        self._needs_rewrite = False  # File must be rewritten rather than appended to
+        # (payload hash, mtime_ns, size) of the last rewrite, if still current
+        self._last_write: Optional[tuple[int, int, int]] = None
+        self._ts_cache = ("", 0.0)  # (formatted timestamp, time() it was formatted at)
         self._load_history()
+        if autosave:
+            _open_histories.add(self)
 
     def add_turn(
         self,
@@ -53,6 +175,10 @@ class ConversationHistory:
     ) -> None:
         """Add a conversation turn to history.
 
+        With autosave, the turn is written to the history file by a background
+        thread, so this never waits on disk I/O; call flush() to write it right
+        away. Without autosave it is only written by flush().
+
         Args:
             model: The model used
             user_prompt: The user's prompt
@@ -61,20 +187,82 @@ class ConversationHistory:
             context: Optional context
         """
         turn = ConversationTurn(
-            timestamp=datetime.now().isoformat(),
+            timestamp=self._timestamp(),
             model=model,
             user_prompt=user_prompt,
             system_prompt=system_prompt,
             context=context,
             response=response,
         )
-        self.turns.append(turn)
+        with self._lock:
+            self.turns.append(turn)
+            self._pending += 1
+
+        if self.autosave:
+            _start_writer()
+            _write_queue.put_nowait(self)
+
+    def _timestamp(self) -> str:
+        """Return the current time in ISO format, reusing a recent formatting."""
+        now = time()
+        formatted, formatted_at = self._ts_cache
+        if now - formatted_at > TIMESTAMP_RESOLUTION:
+            formatted = datetime.fromtimestamp(now).isoformat()
+            self._ts_cache = (formatted, now)
+        return formatted
+
+    def flush(self) -> None:
+        """Write any turns that have not been saved yet.
+
+        New turns are appended to the history file; the file is only rewritten
+        when it has grown to twice the history limit, so trimming stays rare.
+        """
+        with self._write_lock:
+            # Snapshot under the turns lock so add_turn never waits on the write
+            with self._lock:
+                pending = self._pending
+                if not pending:
+                    return
+                rewrite = (
+                    self._needs_rewrite
+                    or pending > len(self.turns)
+                    or self._file_lines + pending > 2 * self.turns.maxlen
+                )
+                if rewrite:
+                    turns = list(self.turns)
+                else:
+                    turns = list(islice(self.turns, len(self.turns) - pending, None))
+
+            if rewrite:
+                written = self._rewrite_history(turns)
+            else:
+                written = self._append_turns(turns)
+            if written:
+                with self._lock:
+                    # Turns added during the write stay pending
+                    self._pending -= pending
+
+    @property
+    def max_items(self) -> int:
+        """Maximum number of turns kept in the history."""
+        return self.turns.maxlen
 
-        # Trim to max items
-        if len(self.turns) > settings.MAX_HISTORY_ITEMS:
-            self.turns = self.turns[-settings.MAX_HISTORY_ITEMS:]
+    @max_items.setter
+    def max_items(self, max_items: int) -> None:
+        self.set_max(max_items)
+
+    def set_max(self, max_items: int) -> None:
+        """Change the history limit, keeping the most recent turns.
+
+        Args:
+            max_items: Maximum number of turns to keep
+        """
+        with self._lock:
+            self.turns = deque(self.turns, maxlen=max_items)
 
-        self._save_history()
+    def reload_settings(self) -> None:
+        """Apply a MAX_HISTORY_ITEMS change made after construction."""
+        self.set_max(settings.MAX_HISTORY_ITEMS)
 
     def get_recent_turns(self, count: int = 10) -> List[ConversationTurn]:
         """Get the most recent conversation turns.
@@ -85,12 +273,18 @@ class ConversationHistory:
         Returns:
             List of recent conversation turns
         """
-        return self.turns[-count:]
+        with self._lock:
+            return list(islice(self.turns, max(0, len(self.turns) - count), None))
 
     def clear_history(self) -> None:
         """Clear all conversation history."""
-        self.turns = []
-        self._save_history()
+        with self._write_lock:
+            with self._lock:
+                self.turns.clear()
+                pending = self._pending
+            if self._rewrite_history([]):
+                with self._lock:
+                    self._pending -= pending
 
     def export_to_file(self, filepath: Path, format: str = "json") -> bool:
         """Export conversation history to a file.
@@ -102,6 +296,7 @@ class ConversationHistory:
         Returns:
             True if successful, False otherwise
         """
+        self.flush()
         try:
             if format == "json":
                 self._export_json(filepath)
@@ -124,67 +319,230 @@ class ConversationHistory:
             True if successful, False otherwise
         """
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            imported_turns = [ConversationTurn.from_dict(turn) for turn in data]
-            self.turns.extend(imported_turns)
-
-            # Trim to max items
-            if len(self.turns) > settings.MAX_HISTORY_ITEMS:
-                self.turns = self.turns[-settings.MAX_HISTORY_ITEMS:]
-
-            self._save_history()
+            data = _loads(Path(filepath).read_bytes())
+
+            # Only the newest turns fit in the history, so don't build the rest
+            imported_turns = [
+                ConversationTurn.from_dict(turn)
+                for turn in data[max(len(data) - self.turns.maxlen, 0):]
+            ]
+            with self._write_lock:
+                with self._lock:
+                    self.turns.extend(imported_turns)
+                    pending = self._pending
+                    turns = list(self.turns)
+                if self._rewrite_history(turns):
+                    with self._lock:
+                        self._pending -= pending
             return True
         except Exception as e:
             print(f"Error importing history: {e}")
             return False
 
+    @property
+    def cursor_file(self) -> Path:
+        """Sidecar file remembering where the kept turns start in the history file."""
+        return self.history_file.with_name(self.history_file.name + ".cursor")
+
+    def _read_cursor(self, stat) -> tuple[int, int]:
+        """Read the load cursor, if it still describes the history file.
+
+        Args:
+            stat: Current stat result of the history file
+
+        Returns:
+            (byte offset, turn lines before it), or (0, 0) to parse the whole file
+        """
+        try:
+            cursor = json.loads(self.cursor_file.read_bytes())
+            offset, skipped = int(cursor["offset"]), int(cursor["skipped"])
+            # A different inode or a shrunken file means the history was
+            # replaced or truncated behind our back; a different limit means
+            # the offset may skip turns that should now be kept
+            if (
+                cursor["maxlen"] == self.turns.maxlen
+                and cursor["inode"] == stat.st_ino
+                and cursor["size"] <= stat.st_size
+                and offset <= stat.st_size
+            ):
+                return offset, skipped
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return 0, 0
+
+    def _write_cursor(self, offset: int, skipped: int) -> None:
+        """Remember where the kept turns start under the current history limit.
+
+        Args:
+            offset: Byte offset of the first kept turn line
+            skipped: Number of turn lines before that offset
+        """
+        try:
+            stat = self.history_file.stat()
+            self.cursor_file.write_text(
+                json.dumps({
+                    "inode": stat.st_ino,
+                    "size": stat.st_size,
+                    "offset": offset,
+                    "skipped": skipped,
+                    "maxlen": self.turns.maxlen,
+                })
+            )
+        except OSError:
+            pass
+
     def _load_history(self) -> None:
-        """Load history from file."""
+        """Load history from file.
+
+        The file holds one JSON turn per line. Files in the older single JSON
+        array format are still read, and get rewritten on the next save.
+
+        Only the newest turns are kept, so the byte offset where they start is
+        saved in a cursor file; the next load seeks there instead of parsing
+        turns that would be dropped anyway.
+        """
         if not self.history_file.exists():
             return
 
         try:
-            with open(self.history_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            self.turns = [ConversationTurn.from_dict(turn) for turn in data]
+            with open(self.history_file, "rb") as f:
+                offset, skipped = self._read_cursor(os.fstat(f.fileno()))
+                if offset:
+                    f.seek(offset - 1)
+                    if f.read(1) != b"\n":
+                        # Cursor does not sit on a line boundary; start over
+                        offset, skipped = 0, 0
+                f.seek(offset)
+                raw = f.read()
+
+            if not offset and raw.lstrip().startswith(b"["):
+                data = _loads(raw)
+                self._needs_rewrite = True
+            else:
+                lines = []  # (byte offset, line) of each turn line
+                pos = offset
+                for line in raw.splitlines(keepends=True):
+                    if line.strip():
+                        lines.append((pos, line))
+                    pos += len(line)
+                self._file_lines = skipped + len(lines)
+
+                kept = lines[max(len(lines) - self.turns.maxlen, 0):]
+                data = []
+                for _, line in kept:
+                    try:
+                        data.append(_loads(line))
+                    except ValueError:
+                        # Torn line from an interrupted append; drop it
+                        self._needs_rewrite = True
+                self._write_cursor(
+                    kept[0][0] if kept else pos,
+                    skipped + len(lines) - len(kept),
+                )
+
+            self.turns.extend(ConversationTurn.from_dict(turn) for turn in data)
         except Exception as e:
             print(f"Error loading history: {e}")
-            self.turns = []
+            self.turns.clear()
+
+    def _append_turns(self, turns: List[ConversationTurn]) -> bool:
+        """Append turns to the history file, one line each.
 
-    def _save_history(self) -> None:
-        """Save history to file."""
+        Returns:
+            True if the turns were written
+        """
         try:
             self.history_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.history_file, "w", encoding="utf-8") as f:
-                data = [turn.to_dict() for turn in self.turns]
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(self.history_file, "ab") as f:
+                f.write(b"".join(_dumps_line(turn.to_dict()) for turn in turns))
+            self._file_lines += len(turns)
+            self._last_write = None
+            return True
         except Exception as e:
             print(f"Error saving history: {e}")
+            return False
+
+    def _rewrite_history(self, turns: List[ConversationTurn]) -> bool:
+        """Rewrite the history file to hold exactly the given turns.
+
+        The new content goes to a temporary file that is renamed over the
+        history file, so a crash never leaves a half-written history behind.
+        Nothing is written if the content matches the previous rewrite and
+        the file is still the one that rewrite left behind. After a failed
+        rewrite, the next flush() rewrites the file instead of appending.
+
+        Args:
+            turns: Snapshot of the in-memory turns
+
+        Returns:
+            True if the file now holds the turns
+        """
+        try:
+            payload = b"".join(_dumps_line(turn.to_dict()) for turn in turns)
+            digest = hash(payload)
+            if not self._unchanged_since_rewrite(digest):
+                self.history_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = self.history_file.with_name(self.history_file.name + ".tmp")
+                tmp_file.write_bytes(payload)
+                os.replace(tmp_file, self.history_file)
+                stat = self.history_file.stat()
+                self._last_write = (digest, stat.st_mtime_ns, stat.st_size)
+                self._write_cursor(0, 0)
+            self._file_lines = len(turns)
+            self._needs_rewrite = False
+            return True
+        except Exception as e:
+            print(f"Error saving history: {e}")
+            self._needs_rewrite = True
+            return False
+
+    def _unchanged_since_rewrite(self, digest: int) -> bool:
+        """Check whether the history file still holds the last rewrite of this payload.
+
+        Args:
+            digest: Hash of the payload about to be written
+
+        Returns:
+            True if the last rewrite had the same payload and the file has not
+            been modified since
+        """
+        if self._last_write is None or self._last_write[0] != digest:
+            return False
+        try:
+            stat = self.history_file.stat()
+        except OSError:
+            return False
+        return self._last_write[1:] == (stat.st_mtime_ns, stat.st_size)
 
     def _export_json(self, filepath: Path) -> None:
         """Export as JSON."""
-        with open(filepath, "w", encoding="utf-8") as f:
+        with self._lock:
             data = [turn.to_dict() for turn in self.turns]
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        Path(filepath).write_bytes(_dumps(data))
 
     def _export_text(self, filepath: Path) -> None:
         """Export as plain text."""
-        with open(filepath, "w", encoding="utf-8") as f:
-            for i, turn in enumerate(self.turns, 1):
-                f.write(f"=" * 80 + "\n")
-                f.write(f"Conversation {i}\n")
-                f.write(f"Timestamp: {turn.timestamp}\n")
-                f.write(f"Model: {turn.model}\n")
-                f.write(f"=" * 80 + "\n\n")
-
-                if turn.system_prompt:
-                    f.write(f"System Prompt:\n{turn.system_prompt}\n\n")
-
-                if turn.context:
-                    f.write(f"Context:\n{turn.context}\n\n")
-
-                f.write(f"User:\n{turn.user_prompt}\n\n")
-                f.write(f"Assistant:\n{turn.response}\n\n")
+        with self._lock:
+            turns = list(self.turns)
+        rule = "=" * 80 + "\n"
+        parts = []
+        for i, turn in enumerate(turns, 1):
+            parts.extend((
+                rule,
+                f"Conversation {i}\n",
+                f"Timestamp: {turn.timestamp}\n",
+                f"Model: {turn.model}\n",
+                rule,
+                "\n",
+            ))
+
+            if turn.system_prompt:
+                parts.append(f"System Prompt:\n{turn.system_prompt}\n\n")
+
+            if turn.context:
+                parts.append(f"Context:\n{turn.context}\n\n")
+
+            parts.append(f"User:\n{turn.user_prompt}\n\n")
+            parts.append(f"Assistant:\n{turn.response}\n\n")
+
+        Path(filepath).write_text("".join(parts), encoding="utf-8")
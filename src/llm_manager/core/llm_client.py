@@ -1,11 +1,13 @@
 """LLM client for communicating with language models."""
 
-from typing import Optional, Generator
-import anthropic
-import openai
-import requests
+from typing import TYPE_CHECKING, Optional, Generator
+import asyncio
 import json
 
+if TYPE_CHECKING:
+    import anthropic
+    import openai
+
 from .models import ModelConfig, get_model_config
 from .settings import settings
 
@@ -14,12 +16,16 @@ class LLMClient:
     """Client for interacting with LLM APIs."""
 
     def __init__(self):
-        """Initialize the LLM client."""
+        """Initialize the LLM client.
+
+        Provider SDKs are imported lazily in set_model so that startup only
+        pays for the provider actually in use.
+        """
         self.current_model: Optional[str] = None
         self.model_config: Optional[ModelConfig] = None
-        self._openai_client: Optional[openai.OpenAI] = None
-        self._anthropic_client: Optional[anthropic.Anthropic] = None
-        self._openai_compatible_client: Optional[openai.OpenAI] = None
+        self._openai_client: Optional["openai.OpenAI"] = None
+        self._anthropic_client: Optional["anthropic.Anthropic"] = None
+        self._openai_compatible_client: Optional["openai.OpenAI"] = None
 
     def set_model(self, model_name: str) -> bool:
         """Set the current model.
@@ -34,13 +40,14 @@ class LLMClient:
         if not config:
             return False
 
-        self.current_model = model_name
-        self.model_config = config
-
-        # Initialize appropriate client
+        # Initialize appropriate client. current_model is only switched once the
+        # client exists, since this may run in a worker thread while the UI
+        # checks current_model to decide whether a send needs set_model first.
         if config.provider == "openai":
             if not settings.OPENAI_API_KEY:
                 return False
+            import openai
+
             self._openai_client = openai.OpenAI(
                 api_key=settings.OPENAI_API_KEY,
                 base_url=settings.OPENAI_BASE_URL,
@@ -48,6 +55,8 @@ class LLMClient:
         elif config.provider == "anthropic":
             if not settings.ANTHROPIC_API_KEY:
                 return False
+            import anthropic
+
             self._anthropic_client = anthropic.Anthropic(
                 api_key=settings.ANTHROPIC_API_KEY
             )
@@ -57,12 +66,16 @@ class LLMClient:
         elif config.provider == "openai_compatible":
             # OpenAI-compatible servers (vLLM, llama.cpp, etc.)
             # API key is optional depending on the server
+            import openai
+
             api_key = settings.OPENAI_COMPATIBLE_API_KEY or "dummy-key"
             self._openai_compatible_client = openai.OpenAI(
                 api_key=api_key,
                 base_url=settings.OPENAI_COMPATIBLE_BASE_URL,
             )
 
+        self.current_model = model_name
+        self.model_config = config
         return True
 
     def send_message(
@@ -111,6 +124,31 @@ class LLMClient:
         else:
             raise ValueError(f"Unsupported provider: {self.model_config.provider}")
 
+    async def asend_message(
+        self,
+        user_prompt: str,
+        system_prompt: str = "",
+        context: str = "",
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """Send a message to the current LLM without blocking the event loop.
+
+        Runs send_message in a worker thread so several clients can be awaited
+        concurrently.
+
+        Args:
+            user_prompt: The user's prompt
+            system_prompt: Optional system prompt
+            context: Optional context information
+            max_tokens: Maximum tokens to generate (uses model default if not specified)
+
+        Returns:
+            The LLM's response text
+        """
+        return await asyncio.to_thread(
+            self.send_message, user_prompt, system_prompt, context, max_tokens
+        )
+
     def _send_openai_message(
         self, user_prompt: str, system_prompt: str, max_tokens: int
     ) -> str:
@@ -184,6 +222,8 @@ class LLMClient:
         self, user_prompt: str, system_prompt: str, max_tokens: int
     ) -> str:
         """Send message to Ollama API."""
+        import requests
+
         # Extract actual model name (remove provider prefix)
         model_name = self.current_model.split(":", 1)[1] if ":" in self.current_model else self.current_model
 
@@ -337,6 +377,8 @@ class LLMClient:
         self, user_prompt: str, system_prompt: str, max_tokens: int
     ) -> Generator[str, None, None]:
         """Stream message from Ollama API."""
+        import requests
+
         # Extract actual model name (remove provider prefix)
         model_name = self.current_model.split(":", 1)[1] if ":" in self.current_model else self.current_model
 
@@ -1,6 +1,7 @@
 """Model configuration for LLM Manager."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict
 import os
 
@@ -248,9 +249,13 @@ def _apply_env_overrides(model_name: str, config: ModelConfig) -> ModelConfig:
     return config
 
 
+@lru_cache(maxsize=None)
 def get_model_config(model_name: str) -> ModelConfig:
     """Get configuration for a specific model with environment overrides applied.
 
+    Overrides are read from the environment on the first lookup of each model;
+    call get_model_config.cache_clear() to pick up later changes.
+
     Args:
         model_name: The model identifier (e.g., "openai:gpt-4o")
 
@@ -1,8 +1,53 @@
 """Persistence layer for pane contents."""
 
+import mmap
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+# Files at least this large are decoded straight from a memory map
+MMAP_MIN_SIZE = 64 * 1024
+
+
+def _read_file(path: str, size: int) -> str:
+    """Read a file as UTF-8 text with universal newlines.
+
+    Args:
+        path: File to read
+        size: Size of the file, to pick how it is read
+
+    Returns:
+        The file content
+    """
+    if size < MMAP_MIN_SIZE:
+        text = Path(path).read_bytes().decode("utf-8")
+    else:
+        # Decode from the mapping itself rather than copying the bytes out first
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            text = str(m, "utf-8")
+    # Match read_text's universal newline handling
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+@lru_cache(maxsize=64)
+def _read_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read a small file, memoized on its modification time and size.
+
+    Only files below MMAP_MIN_SIZE should go through here, so the cache
+    holds at most 64 small texts.
+
+    Args:
+        path: File to read
+        mtime_ns: Modification time of the file, part of the cache key
+        size: Size of the file, part of the cache key
+
+    Returns:
+        The file content
+    """
+    return _read_file(path, size)
+
 
 class PaneStorage:
     """Handles reading and writing pane content to persistent storage."""
@@ -14,13 +59,16 @@ class PaneStorage:
             file_path: Path to the file where pane content will be stored
         """
         self.file_path = file_path
+        # (mtime_ns, size, content) as last read or written, checked against
+        # the file on every read so outside changes are picked up
+        self._cache: Optional[tuple[int, int, str]] = None
         self._ensure_exists()
 
     def _ensure_exists(self) -> None:
         """Ensure the storage file exists."""
         if not self.file_path.exists():
             self.file_path.parent.mkdir(parents=True, exist_ok=True)
-            self.file_path.write_text("", encoding="utf-8")
+            self.file_path.write_bytes(b"")
 
     def read(self) -> str:
         """Read content from storage.
@@ -29,7 +77,16 @@ class PaneStorage:
             The stored content as a string
         """
         try:
-            return self.file_path.read_text(encoding="utf-8")
+            stat = self.file_path.stat()
+            if self._cache is not None and self._cache[:2] == (stat.st_mtime_ns, stat.st_size):
+                return self._cache[2]
+            if stat.st_size < MMAP_MIN_SIZE:
+                # Storages re-created for the same file share one read until it changes
+                content = _read_cached(str(self.file_path), stat.st_mtime_ns, stat.st_size)
+            else:
+                content = _read_file(str(self.file_path), stat.st_size)
+            self._cache = (stat.st_mtime_ns, stat.st_size, content)
+            return content
         except Exception as e:
             # If read fails, return empty string and log error
             print(f"Error reading from {self.file_path}: {e}")
@@ -45,9 +102,12 @@ class PaneStorage:
             True if successful, False otherwise
         """
         try:
-            self.file_path.write_text(content, encoding="utf-8")
+            self.file_path.write_bytes(content.encode("utf-8"))
+            stat = self.file_path.stat()
+            self._cache = (stat.st_mtime_ns, stat.st_size, content)
             return True
         except Exception as e:
+            self._cache = None
             print(f"Error writing to {self.file_path}: {e}")
             return False
 
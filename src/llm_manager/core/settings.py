@@ -21,12 +21,43 @@ Global Overrides:
 """
 
 from pathlib import Path
+from typing import Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 # Project root directory
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
 
+# Base directory for all application state, resolved once at import
+APP_HOME = (Path.home() / ".llm_manager").resolve()
+
+
+def _app_paths(app_home: Path) -> dict:
+    """Build the default application paths under a base directory.
+
+    Args:
+        app_home: Base directory for application state
+
+    Returns:
+        Mapping of path setting names to their default paths
+    """
+    data_dir = app_home / "data"
+    return {
+        "DATA_DIR": data_dir,
+        "RUNTIME_DIR": app_home / "runtime",
+        "PROMPTS_DIR": app_home / "prompts",
+        "USER_PROMPT_FILE": data_dir / "user_prompt.txt",
+        "SYSTEM_PROMPT_FILE": data_dir / "system_prompt.txt",
+        "CONTEXT_FILE": data_dir / "context.txt",
+        "SELECTED_MODEL_FILE": data_dir / "selected_model.txt",
+        "CONVERSATION_HISTORY_FILE": data_dir / "conversation_history.json",
+    }
+
+
+# Default paths under APP_HOME, the single source for the Settings defaults
+_DEFAULT_PATHS = _app_paths(APP_HOME)
+
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
@@ -38,15 +69,15 @@ class Settings(BaseSettings):
     )
 
     # Application paths
-    DATA_DIR: Path = Path.home() / ".llm_manager" / "data"
-    RUNTIME_DIR: Path = Path.home() / ".llm_manager" / "runtime"
-    PROMPTS_DIR: Path = Path.home() / ".llm_manager" / "prompts"
+    DATA_DIR: Path = _DEFAULT_PATHS["DATA_DIR"]
+    RUNTIME_DIR: Path = _DEFAULT_PATHS["RUNTIME_DIR"]
+    PROMPTS_DIR: Path = _DEFAULT_PATHS["PROMPTS_DIR"]
 
     # Pane content persistence files
-    USER_PROMPT_FILE: Path = DATA_DIR / "user_prompt.txt"
-    SYSTEM_PROMPT_FILE: Path = DATA_DIR / "system_prompt.txt"
-    CONTEXT_FILE: Path = DATA_DIR / "context.txt"
-    SELECTED_MODEL_FILE: Path = DATA_DIR / "selected_model.txt"
+    USER_PROMPT_FILE: Path = _DEFAULT_PATHS["USER_PROMPT_FILE"]
+    SYSTEM_PROMPT_FILE: Path = _DEFAULT_PATHS["SYSTEM_PROMPT_FILE"]
+    CONTEXT_FILE: Path = _DEFAULT_PATHS["CONTEXT_FILE"]
+    SELECTED_MODEL_FILE: Path = _DEFAULT_PATHS["SELECTED_MODEL_FILE"]
 
     # Application configuration
     EDITOR: str = "nvim"
@@ -69,9 +100,22 @@ class Settings(BaseSettings):
     ENABLE_STREAMING: bool = True
 
     # Conversation history
-    CONVERSATION_HISTORY_FILE: Path = DATA_DIR / "conversation_history.json"
+    CONVERSATION_HISTORY_FILE: Path = _DEFAULT_PATHS["CONVERSATION_HISTORY_FILE"]
     MAX_HISTORY_ITEMS: int = 100
 
+    def __init__(self, home_dir: Optional[Path] = None, **values):
+        """Initialize settings.
+
+        Args:
+            home_dir: Home directory to keep application state under, instead
+                of the user's home; explicitly passed paths still take precedence
+            **values: Setting values, overriding the environment
+        """
+        if home_dir is not None:
+            for name, path in _app_paths(Path(home_dir) / ".llm_manager").items():
+                values.setdefault(name, path)
+        super().__init__(**values)
+
     def ensure_dirs(self) -> None:
         """Ensure all required directories exist."""
         self.DATA_DIR.mkdir(parents=True, exist_ok=True)
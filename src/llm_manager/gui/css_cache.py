@@ -0,0 +1,22 @@
+"""Per-class caching of Textual default CSS sources."""
+
+# Default CSS sources of each widget class, collected on first registration
+_DEFAULT_CSS_SOURCES: dict[type, list] = {}
+
+
+class CachedDefaultCSS:
+    """Mixin that collects a widget class's default CSS sources only once.
+
+    Textual gathers these by walking the class bases every time a widget is
+    registered, but the result only depends on the class. This overrides
+    Textual's private _get_default_css hook, so recheck it when upgrading
+    Textual. List the mixin before the Textual base class.
+    """
+
+    def _get_default_css(self) -> list:
+        """Return the default CSS sources for this class, collected once per class."""
+        cls = type(self)
+        sources = _DEFAULT_CSS_SOURCES.get(cls)
+        if sources is None:
+            sources = _DEFAULT_CSS_SOURCES[cls] = super()._get_default_css()
+        return sources
@@ -102,8 +102,10 @@ class HelpScreen(ModalScreen):
                     "LLM Operations",
                     [
                         ("Ctrl+J", "Send prompts to LLM"),
+                        ("Ctrl+K", "Send prompts to all compared models"),
                         ("↑/↓", "Navigate LLM models (when in LLM pane)"),
                         ("Enter", "Select LLM model (when in LLM pane)"),
+                        ("Space", "Mark model for comparison (when in LLM pane)"),
                     ]
                 ), classes="help-section")
 
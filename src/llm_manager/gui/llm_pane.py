@@ -18,6 +18,7 @@ class LLMSelectionPane(Container, can_focus=True):
 
     BINDINGS = [
         Binding("escape", "exit_select_mode", "Exit Select Mode", show=False),
+        Binding("space", "toggle_compare", "Compare", show=False),
     ]
 
     DEFAULT_CSS = """
@@ -99,6 +100,7 @@ class LLMSelectionPane(Container, can_focus=True):
         self.selected_model: str | None = None
         self.select_mode: bool = False  # Track if in model select mode
         self.staged_model: str | None = None  # Track temporary selection
+        self.compare_models: list[str] = []  # Models marked for multi-model sends
         self._load_selected_model()
 
     def compose(self) -> ComposeResult:
@@ -151,7 +153,7 @@ class LLMSelectionPane(Container, can_focus=True):
 
         yield Static("", classes="feedback-box", id="feedback-box")
         yield Label(
-            "Press Enter to select | Up/Down to navigate",
+            "Press Enter to select | Up/Down to navigate | Space: compare",
             classes="pane-footer"
         )
 
@@ -246,6 +248,9 @@ class LLMSelectionPane(Container, can_focus=True):
         try:
             if settings.SELECTED_MODEL_FILE.exists():
                 self.selected_model = settings.SELECTED_MODEL_FILE.read_text().strip()
+            else:
+                # First run: the file is created in the background after startup
+                self.selected_model = settings.DEFAULT_MODEL
         except Exception:
             self.selected_model = settings.DEFAULT_MODEL
 
@@ -274,6 +279,19 @@ class LLMSelectionPane(Container, can_focus=True):
             self.staged_model = highlighted_option.id
             self._update_feedback_box()
 
+    def action_toggle_compare(self) -> None:
+        """Mark or unmark the highlighted model for multi-model sends."""
+        option_list = self.query_one("#model-option-list", OptionList)
+        highlighted_option = option_list.get_option_at_index(option_list.highlighted)
+        if not highlighted_option or not highlighted_option.id:
+            return
+
+        if highlighted_option.id in self.compare_models:
+            self.compare_models.remove(highlighted_option.id)
+        else:
+            self.compare_models.append(highlighted_option.id)
+        self._update_feedback_box()
+
     def action_exit_select_mode(self) -> None:
         """Exit select mode with confirmation if model changed."""
         if not self.select_mode:
@@ -324,9 +342,21 @@ class LLMSelectionPane(Container, can_focus=True):
             config = get_model_config(self.staged_model)
             model_display = config.display_name if config else self.staged_model
             feedback_box.update(f"Staged: {model_display}")
+        elif self.compare_models:
+            feedback_box.update(f"Compare: {len(self.compare_models)} models")
         else:
             feedback_box.update("")
 
     def get_selected_model(self) -> str | None:
         """Get the currently selected model."""
         return self.selected_model
+
+    def get_selected_models(self) -> list[str]:
+        """Get the models to send to for multi-model comparison.
+
+        Returns:
+            The models marked for comparison, or just the selected model if none are marked
+        """
+        if self.compare_models:
+            return list(self.compare_models)
+        return [self.selected_model] if self.selected_model else []
@@ -1,6 +1,8 @@
 """Main window for the LLM Manager application."""
 
 import asyncio
+import concurrent.futures
+import threading
 from pathlib import Path
 from datetime import datetime
 from enum import Enum
@@ -21,6 +23,11 @@ from .menu import PaneMenuScreen
 from .root_pane import RootPane
 from .prompt_manager_screen import PromptManagerScreen
 
+# Streaming: max chunks buffered between the network thread and the UI,
+# and max chunks merged into a single response-pane update
+STREAM_QUEUE_SIZE = 256
+STREAM_BATCH_CHUNKS = 8
+
 
 class PaneState(Enum):
     """Pane visibility states."""
@@ -89,6 +96,7 @@ class LLMManagerApp(App):
         Binding("ctrl+s", "save_focused", "Save", show=True),
         Binding("p", "open_prompt_manager", "Prompt Mgr", show=True),
         Binding("ctrl+j", "send_to_llm", "Send", show=True, priority=True),
+        Binding("ctrl+k", "send_to_all", "Send All", show=False),
         Binding("s", "toggle_streaming", "Stream Toggle", show=False),
         Binding("c", "clear_response", "Clear", show=False),
         Binding("ctrl+e", "export_conversation", "Export", show=False),
@@ -108,7 +116,9 @@ class LLMManagerApp(App):
     def __init__(self):
         """Initialize the application."""
         super().__init__()
-        settings.ensure_files()
+
+        # Resolve the home directory once; exports are written there
+        self._home = Path.home()
 
         # Create LLM client and conversation history
         self.llm_client = LLMClient()
@@ -124,6 +134,7 @@ class LLMManagerApp(App):
             title="User Prompt",
             storage_path=settings.USER_PROMPT_FILE,
             editor=settings.EDITOR,
+            load_on_mount=False,
             id="user-prompt-pane"
         )
 
@@ -131,6 +142,7 @@ class LLMManagerApp(App):
             title="System Prompt",
             storage_path=settings.SYSTEM_PROMPT_FILE,
             editor=settings.EDITOR,
+            load_on_mount=False,
             id="system-prompt-pane"
         )
 
@@ -138,6 +150,7 @@ class LLMManagerApp(App):
             title="Context",
             storage_path=settings.CONTEXT_FILE,
             editor=settings.EDITOR,
+            load_on_mount=False,
             id="context-pane"
         )
 
@@ -155,6 +168,30 @@ class LLMManagerApp(App):
             id="root-pane"
         )
 
+        # Position of each pane in the Tab order, and the pane focus is currently in
+        self._pane_index = {pane: i for i, (pane, _) in enumerate(self._get_pane_list())}
+        self._current_pane_index = 0
+
+        # Each pane's (display name, layout row); root spans all rows
+        self._pane_meta = {
+            self.root_pane: ("Root", None),
+            self.user_prompt_pane: ("User Prompt", 0),
+            self.system_prompt_pane: ("System Prompt", 0),
+            self.context_pane: ("Context", 1),
+            self.llm_selection_pane: ("LLM Selection", 1),
+            self.response_pane: ("Response", 2),
+        }
+
+        # Editable panes mapped to (display name, edit handler, save handler)
+        self._editable_dispatch = {
+            pane: (name, pane.edit_with_nvim, pane.save_content)
+            for pane, name in (
+                (self.user_prompt_pane, "User Prompt"),
+                (self.system_prompt_pane, "System Prompt"),
+                (self.context_pane, "Context"),
+            )
+        }
+
     def _compose_child_panes(self) -> ComposeResult:
         """Compose the layout of child panes within the root pane."""
         # First row: User Prompt and System Prompt side by side
@@ -204,14 +241,30 @@ class LLMManagerApp(App):
         # Focus root pane by default to show hierarchy
         self.root_pane.focus()
 
-        # Load selected model
+        # Create data files and load pane contents without delaying the first paint
+        self.run_worker(self._prepare_storage(), exclusive=True, group="storage")
+
+        # Load selected model in the background; provider SDK setup can be slow
         selected_model = self.llm_selection_pane.get_selected_model()
         if selected_model:
-            success = self.llm_client.set_model(selected_model)
-            if success:
-                self.notify(f"Model loaded: {selected_model}", severity="information")
-            else:
-                self.notify("Failed to load model. Check API keys.", severity="warning")
+            self.run_worker(self._load_model(selected_model), group="init")
+
+    async def _load_model(self, model_name: str) -> None:
+        """Initialize the LLM client for a model in a worker thread."""
+        success = await asyncio.to_thread(self.llm_client.set_model, model_name)
+        if success:
+            self.notify(f"Model loaded: {model_name}", severity="information")
+        else:
+            self.notify("Failed to load model. Check API keys.", severity="warning")
+
+    async def _prepare_storage(self) -> None:
+        """Ensure the data files exist, then load the editable panes from them."""
+        await asyncio.to_thread(settings.ensure_files)
+        await asyncio.gather(
+            self.user_prompt_pane.load_content_in_thread(),
+            self.system_prompt_pane.load_content_in_thread(),
+            self.context_pane.load_content_in_thread(),
+        )
 
     def action_focus_root(self) -> None:
         """Focus the root pane."""
@@ -258,90 +311,65 @@ class LLMManagerApp(App):
             (self.response_pane, "Response"),
         ]
 
-    def _find_current_pane_index(self, panes):
-        """Find the index of the currently focused pane.
-
-        Walks up the widget tree from the focused widget to find which
-        top-level pane contains it.
-        """
-        focused = self.focused
-        if not focused:
-            return 0  # Default to first pane if nothing focused
-
-        # Walk up from focused widget to find which pane it belongs to
-        current = focused
+    def on_descendant_focus(self, event) -> None:
+        """Track which top-level pane contains the newly focused widget."""
+        current = event.widget
         while current is not None:
-            # Check if this widget is one of our panes
-            for i, (pane, _) in enumerate(panes):
-                if current is pane:
-                    return i
+            index = self._pane_index.get(current)
+            if index is not None:
+                self._current_pane_index = index
+                return
             current = current.parent
 
-        return 0  # Default to first pane if not found
-
     def action_focus_next(self) -> None:
         """Focus the next pane in sequence."""
         panes = self._get_pane_list()
-        current_index = self._find_current_pane_index(panes)
 
         # Move to next pane (wrap around to first if at the end)
-        next_index = (current_index + 1) % len(panes)
+        next_index = (self._current_pane_index + 1) % len(panes)
         next_pane, next_name = panes[next_index]
         next_pane.focus()
 
     def action_focus_previous(self) -> None:
         """Focus the previous pane in sequence."""
         panes = self._get_pane_list()
-        current_index = self._find_current_pane_index(panes)
 
         # Move to previous pane (wrap around to last if at the beginning)
-        prev_index = (current_index - 1) % len(panes)
+        prev_index = (self._current_pane_index - 1) % len(panes)
         prev_pane, prev_name = panes[prev_index]
         prev_pane.focus()
 
-    def action_edit_focused(self) -> None:
-        """Edit the currently focused pane in external editor."""
-        focused = self.focused
-
-        # Find which pane is focused by checking the widget's ancestry
-        # We need to walk up the tree to find the EditablePane container
-        current = focused
+    def _get_focused_editable(self):
+        """Get the editable pane that currently contains focus, if any."""
+        # Walk up from the focused widget itself: _current_pane_index keeps the
+        # last pane while focus is in a menu or dialog
+        current = self.focused
         while current is not None:
-            if current is self.user_prompt_pane:
-                self.user_prompt_pane.edit_with_nvim()
-                return
-            elif current is self.system_prompt_pane:
-                self.system_prompt_pane.edit_with_nvim()
-                return
-            elif current is self.context_pane:
-                self.context_pane.edit_with_nvim()
-                return
+            if current in self._editable_dispatch:
+                return current
             current = current.parent
+        return None
 
-        self.notify("No editable pane focused", severity="warning")
+    def action_edit_focused(self) -> None:
+        """Edit the currently focused pane in external editor."""
+        pane = self._get_focused_editable()
+        if pane is None:
+            self.notify("No editable pane focused", severity="warning")
+            return
+
+        _, edit, _ = self._editable_dispatch[pane]
+        edit()
 
     def action_save_focused(self) -> None:
         """Save the currently focused pane."""
-        focused = self.focused
-
-        # Find which pane is focused
-        current = focused
-        while current is not None:
-            if current is self.user_prompt_pane:
-                if self.user_prompt_pane.save_content():
-                    self.notify("User Prompt saved", severity="information")
-                return
-            elif current is self.system_prompt_pane:
-                if self.system_prompt_pane.save_content():
-                    self.notify("System Prompt saved", severity="information")
-                return
-            elif current is self.context_pane:
-                if self.context_pane.save_content():
-                    self.notify("Context saved", severity="information")
-                return
-            current = current.parent
+        pane = self._get_focused_editable()
+        if pane is None:
+            self.notify("No editable pane focused", severity="warning")
+            return
 
-        self.notify("No editable pane focused", severity="warning")
+        # The pane reports success once the write has actually happened
+        _, _, save = self._editable_dispatch[pane]
+        save(announce=True)
 
     def action_send_to_llm(self) -> None:
         """Send the current prompts to the LLM."""
@@ -351,13 +379,6 @@ class LLMManagerApp(App):
             self.notify("Please select a model first (press 4)", severity="error")
             return
 
-        # Set model if not already set
-        if self.llm_client.current_model != selected_model:
-            success = self.llm_client.set_model(selected_model)
-            if not success:
-                self.notify("Failed to initialize model. Check API keys.", severity="error")
-                return
-
         # Get prompts
         user_prompt = self.user_prompt_pane.content
         system_prompt = self.system_prompt_pane.content
@@ -370,23 +391,81 @@ class LLMManagerApp(App):
         # Clear previous response
         self.response_pane.clear_response()
 
+        self.run_worker(self._send_to_llm(selected_model, user_prompt, system_prompt, context))
+
+    async def _send_to_llm(
+        self, model: str, user_prompt: str, system_prompt: str, context: str
+    ) -> None:
+        """Switch the client to the model if needed, then send the prompts."""
+        # Set model if not already set; set_model imports the provider SDK,
+        # so keep it off the event loop
+        if self.llm_client.current_model != model:
+            if not await asyncio.to_thread(self.llm_client.set_model, model):
+                self.notify("Failed to initialize model. Check API keys.", severity="error")
+                return
+
         # Send based on streaming setting
         if self.response_pane.streaming_enabled:
-            self.run_worker(self._send_streaming(user_prompt, system_prompt, context))
+            await self._send_streaming(user_prompt, system_prompt, context)
         else:
-            self.run_worker(self._send_non_streaming(user_prompt, system_prompt, context))
+            await self._send_non_streaming(user_prompt, system_prompt, context)
 
     async def _send_streaming(self, user_prompt: str, system_prompt: str, context: str) -> None:
         """Send message with streaming enabled."""
         self.response_pane.set_status("Streaming...")
 
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        stop = threading.Event()
+        parts: list[str] = []
+
+        def put(item: str | None) -> bool:
+            """Hand an item to the UI loop, waiting while the queue is full."""
+            future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+            while not stop.is_set():
+                try:
+                    future.result(timeout=0.1)
+                    return True
+                except concurrent.futures.TimeoutError:
+                    continue
+            future.cancel()
+            return False
+
+        def produce() -> None:
+            """Drain the blocking network stream from a worker thread."""
+            try:
+                for chunk in self.llm_client.stream_message(user_prompt, system_prompt, context):
+                    if not put(chunk):
+                        return
+            finally:
+                put(None)
+
+        async def consume() -> None:
+            """Render queued chunks, coalescing whatever has piled up since the last render."""
+            batch: list[str] = []
+            try:
+                while True:
+                    chunk = await queue.get()
+                    if chunk is not None:
+                        parts.append(chunk)
+                        batch.append(chunk)
+                    if batch and (
+                        chunk is None or len(batch) >= STREAM_BATCH_CHUNKS or queue.empty()
+                    ):
+                        self.response_pane.append_response_chunk("".join(batch))
+                        batch.clear()
+                        # Yield so the UI can repaint; get() won't while chunks are queued
+                        await asyncio.sleep(0)
+                    if chunk is None:
+                        break
+            finally:
+                # Release the producer if rendering stops early
+                stop.set()
+
         try:
-            full_response = ""
-            for chunk in self.llm_client.stream_message(user_prompt, system_prompt, context):
-                full_response += chunk
-                self.response_pane.append_response_chunk(chunk)
-                await asyncio.sleep(0.01)  # Small delay for UI update
+            await asyncio.gather(asyncio.to_thread(produce), consume())
 
+            full_response = "".join(parts)
             self.response_pane.set_status("Complete")
 
             # Save to history
@@ -428,6 +507,70 @@ class LLMManagerApp(App):
             self.response_pane.show_error(str(e))
             self.notify(f"Error: {str(e)}", severity="error")
 
+    def action_send_to_all(self) -> None:
+        """Send the current prompts to every model marked for comparison."""
+        models = self.llm_selection_pane.get_selected_models()
+        if not models:
+            self.notify("Please select a model first (press 4)", severity="error")
+            return
+
+        # Get prompts
+        user_prompt = self.user_prompt_pane.content
+        system_prompt = self.system_prompt_pane.content
+        context = self.context_pane.content
+
+        if not user_prompt.strip():
+            self.notify("User prompt is empty", severity="warning")
+            return
+
+        # Clear previous response
+        self.response_pane.clear_response()
+
+        self.run_worker(self._send_to_all(models, user_prompt, system_prompt, context))
+
+    async def _send_to_all(
+        self, models: list[str], user_prompt: str, system_prompt: str, context: str
+    ) -> None:
+        """Send to several models concurrently, rendering each reply as it arrives."""
+        self.response_pane.set_status(f"Waiting for {len(models)} models...")
+
+        async def ask(model: str) -> tuple[str, str | None, str | None]:
+            # Each model gets its own client since LLMClient holds a single model
+            client = LLMClient()
+            # set_model imports the provider SDK, so keep it off the event loop
+            if not await asyncio.to_thread(client.set_model, model):
+                return model, None, "Failed to initialize model. Check API keys."
+            try:
+                response = await client.asend_message(user_prompt, system_prompt, context)
+            except Exception as e:
+                return model, None, str(e)
+            return model, response, None
+
+        failures = 0
+        for next_result in asyncio.as_completed([ask(model) for model in models]):
+            model, response, error = await next_result
+            if error is not None:
+                failures += 1
+                self.response_pane.append_response_chunk(f"=== {model} ===\nError: {error}\n\n")
+                continue
+
+            self.response_pane.append_response_chunk(f"=== {model} ===\n{response}\n\n")
+
+            # Save to history
+            self.conversation_history.add_turn(
+                model=model,
+                user_prompt=user_prompt,
+                response=response,
+                system_prompt=system_prompt,
+                context=context,
+            )
+
+        self.response_pane.set_status("Complete")
+        if failures:
+            self.notify(f"{failures} of {len(models)} models failed", severity="warning")
+        else:
+            self.notify(f"Responses received from {len(models)} models", severity="information")
+
     def action_toggle_streaming(self) -> None:
         """Toggle streaming mode."""
         self.response_pane.toggle_streaming()
@@ -439,10 +582,14 @@ class LLMManagerApp(App):
 
     def action_export_conversation(self) -> None:
         """Export conversation history."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filepath = Path.home() / f"llm_conversation_{timestamp}.json"
+        filepath = self._home / f"llm_conversation_{datetime.now():%Y%m%d_%H%M%S}.json"
+        self.run_worker(self._export_conversation(filepath), group="export")
 
-        success = self.conversation_history.export_to_file(filepath, format="json")
+    async def _export_conversation(self, filepath: Path) -> None:
+        """Write the history export in a thread so large histories don't block the UI."""
+        success = await asyncio.to_thread(
+            self.conversation_history.export_to_file, filepath, "json"
+        )
         if success:
             self.notify(f"Exported to {filepath}", severity="information")
         else:
@@ -456,31 +603,11 @@ class LLMManagerApp(App):
 
     def action_open_prompt_manager(self) -> None:
         """Open prompt manager for the currently focused pane."""
-        focused = self.focused
-        current = focused
-
-        # Find which pane is focused
-        pane_name = None
-        target_pane = None
-
-        while current is not None:
-            if current is self.user_prompt_pane:
-                pane_name = "User Prompt"
-                target_pane = self.user_prompt_pane
-                break
-            elif current is self.system_prompt_pane:
-                pane_name = "System Prompt"
-                target_pane = self.system_prompt_pane
-                break
-            elif current is self.context_pane:
-                pane_name = "Context"
-                target_pane = self.context_pane
-                break
-            current = current.parent
-
-        if not pane_name or not target_pane:
+        target_pane = self._get_focused_editable()
+        if target_pane is None:
             self.notify("Prompt manager only works for User Prompt, System Prompt, and Context panes", severity="warning")
             return
+        pane_name, _, _ = self._editable_dispatch[target_pane]
 
         # Open the prompt manager screen
         self.push_screen(
@@ -505,9 +632,9 @@ class LLMManagerApp(App):
 
         if action == "load":
             # Load prompt from file
-            file_path = Path(result.get("path"))
-            if file_path.exists():
-                new_content = file_path.read_text(encoding="utf-8")
+            # The prompt manager reads the file when the load is confirmed
+            new_content = result.get("content")
+            if new_content is not None:
                 mode = result.get("mode", "replace")  # Default to replace if no mode specified
 
                 if mode == "replace":
@@ -523,7 +650,7 @@ class LLMManagerApp(App):
                     # Insert at cursor position
                     # Get the TextArea widget to access cursor position
                     try:
-                        text_area = target_pane.query_one(f"#{target_pane.id}-content")
+                        text_area = target_pane.query_one(target_pane._content_sel)
                         cursor = text_area.cursor_location
                         current_text = text_area.text
 
@@ -571,17 +698,8 @@ class LLMManagerApp(App):
 
     def _get_pane_row(self, pane):
         """Get the row container for a given pane."""
-        # Root pane contains all rows, so it doesn't have a specific row
-        if pane == self.root_pane:
-            return None
-        # Map child panes to their row indices
-        elif pane in [self.user_prompt_pane, self.system_prompt_pane]:
-            return 0
-        elif pane in [self.context_pane, self.llm_selection_pane]:
-            return 1
-        elif pane == self.response_pane:
-            return 2
-        return None
+        meta = self._pane_meta.get(pane)
+        return meta[1] if meta else None
 
     def action_toggle_maximize(self) -> None:
         """Toggle maximize state for the currently focused pane."""
@@ -663,10 +781,8 @@ class LLMManagerApp(App):
 
     def _get_pane_name(self, pane):
         """Get the display name of a pane."""
-        for p, name in self._get_pane_list():
-            if p == pane:
-                return name
-        return "Unknown"
+        meta = self._pane_meta.get(pane)
+        return meta[0] if meta else "Unknown"
 
     def action_increase_height(self) -> None:
         """Increase height/state of the focused pane.
@@ -1,13 +1,28 @@
 """Menu system for LLM Manager."""
 
+from functools import partial
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Vertical
 from textual.screen import ModalScreen
 from textual.widgets import Static, OptionList, Label
 from textual.widgets.option_list import Option
+from rich.style import Style
 from rich.text import Text
 
+# Fixed menu labels, built once so each menu open skips Rich style parsing
+_HIERARCHY_HEADER = Text("═══ Pane Hierarchy ═══", style="bold cyan")
+_ROOT_LABEL = Text("🌳 Root", style="bold magenta")
+_SEPARATOR = Text("─────────────────────", style="dim")
+_PANE_ACTIONS_HEADER = Text("═══ Pane Actions ═══", style="bold magenta")
+_ROOT_ACTIONS_HEADER = Text("═══ Root Actions ═══", style="bold yellow")
+
+# Styles for the per-pane status rows
+_STYLE_HIDDEN = Style.parse("dim")
+_STYLE_MAXIMIZED = Style.parse("bold green")
+_STYLE_MINIMIZED = Style.parse("yellow")
+_STYLE_VISIBLE = Style.parse("white")
+
 
 class PaneMenuScreen(ModalScreen):
     """Modal screen for pane management menu."""
@@ -72,6 +87,17 @@ class PaneMenuScreen(ModalScreen):
         super().__init__(name=name, id=id, classes=classes)
         self.app_ref = app_ref
 
+        # Option ids mapped to their handlers; pane rows are filled in by compose
+        self._action_handlers = {
+            "action_select": self.dismiss,
+            "action_hide": self._hide_highlighted_pane,
+            "action_unhide": self._unhide_highlighted_pane,
+            "action_hide_all": partial(self._run_root_action, app_ref.action_hide_all_children),
+            "action_show_all": partial(self._run_root_action, app_ref.action_show_all_children),
+            "action_reset": partial(self._run_root_action, app_ref.action_reset_layout),
+        }
+        self._pane_by_option_id = {}
+
     def compose(self) -> ComposeResult:
         """Compose the menu screen."""
         with Container(id="menu-dialog"):
@@ -81,50 +107,34 @@ class PaneMenuScreen(ModalScreen):
             options = []
 
             # Hierarchical pane structure
-            options.append(Option(Text("═══ Pane Hierarchy ═══", style="bold cyan"), disabled=True))
+            options.append(Option(_HIERARCHY_HEADER, disabled=True))
 
             # Root pane
             root_pane = self.app_ref.root_pane
             root_id = root_pane.id if hasattr(root_pane, 'id') else str(id(root_pane))
-            options.append(Option(Text("🌳 Root", style="bold magenta"), id=f"pane_{root_id}"))
+            options.append(Option(_ROOT_LABEL, id=f"pane_{root_id}"))
+            self._pane_by_option_id[f"pane_{root_id}"] = root_pane
 
             # Child panes (indented)
             for pane, name in self.app_ref._get_child_panes():
                 pane_id = pane.id if hasattr(pane, 'id') else str(id(pane))
-                is_hidden = pane.styles.display == "none"
-
-                # Show status indicator
-                if is_hidden:
-                    status = "🔒 Hidden"
-                    style = "dim"
-                elif self.app_ref.maximized_pane == pane:
-                    status = "📌 Maximized"
-                    style = "bold green"
-                elif self.app_ref.pane_states.get(pane) == self.app_ref.PaneState.MINIMIZED:
-                    status = "📉 Minimized"
-                    style = "yellow"
-                else:
-                    status = "👁 Visible"
-                    style = "white"
-
-                # Add tree-style indentation
-                label = Text(f"  ├─ {name:18} {status}", style=style)
-                options.append(Option(label, id=f"pane_{pane_id}"))
+                options.append(Option(self._pane_label(pane, name), id=f"pane_{pane_id}"))
+                self._pane_by_option_id[f"pane_{pane_id}"] = pane
 
             # Separator
-            options.append(Option(Text("─────────────────────", style="dim"), disabled=True))
+            options.append(Option(_SEPARATOR, disabled=True))
 
             # Pane actions section
-            options.append(Option(Text("═══ Pane Actions ═══", style="bold magenta"), disabled=True))
+            options.append(Option(_PANE_ACTIONS_HEADER, disabled=True))
             options.append(Option("📋 Select/Focus Pane", id="action_select"))
             options.append(Option("🔒 Hide Selected Pane", id="action_hide"))
             options.append(Option("👁 Unhide Selected Pane", id="action_unhide"))
 
             # Separator
-            options.append(Option(Text("─────────────────────", style="dim"), disabled=True))
+            options.append(Option(_SEPARATOR, disabled=True))
 
             # Root-level actions
-            options.append(Option(Text("═══ Root Actions ═══", style="bold yellow"), disabled=True))
+            options.append(Option(_ROOT_ACTIONS_HEADER, disabled=True))
             options.append(Option("🌳 Hide All Children", id="action_hide_all"))
             options.append(Option("🌳 Show All Children", id="action_show_all"))
             options.append(Option("🌳 Reset Layout", id="action_reset"))
@@ -132,6 +142,34 @@ class PaneMenuScreen(ModalScreen):
             yield OptionList(*options, id="menu-options")
             yield Label("↑/↓ Navigate | Enter Select | ESC/Q Close", id="menu-status")
 
+    def _pane_label(self, pane, name) -> Text:
+        """Build the tree row for a child pane, showing its current state."""
+        is_hidden = pane.styles.display == "none"
+
+        # Show status indicator
+        if is_hidden:
+            status = "🔒 Hidden"
+            style = _STYLE_HIDDEN
+        elif self.app_ref.maximized_pane == pane:
+            status = "📌 Maximized"
+            style = _STYLE_MAXIMIZED
+        elif self.app_ref.pane_states.get(pane) == self.app_ref.PaneState.MINIMIZED:
+            status = "📉 Minimized"
+            style = _STYLE_MINIMIZED
+        else:
+            status = "👁 Visible"
+            style = _STYLE_VISIBLE
+
+        # Add tree-style indentation
+        return Text(f"  ├─ {name:18} {status}", style=style)
+
+    def _refresh_pane_option(self, option_list, index, pane):
+        """Redraw a single pane row in place after its state changed."""
+        if pane is self.app_ref.root_pane:
+            return
+        label = self._pane_label(pane, self.app_ref._get_pane_name(pane))
+        option_list.replace_option_prompt_at_index(index, label)
+
     def on_option_list_option_selected(self, event):
         """Handle menu option selection."""
         option_id = event.option.id
@@ -139,34 +177,20 @@ class PaneMenuScreen(ModalScreen):
         if not option_id:
             return
 
-        if option_id.startswith("pane_"):
-            # Extract pane ID and find the pane
-            pane = self._find_pane_by_id(option_id)
-            if pane:
-                self._handle_pane_selection(pane)
-        elif option_id == "action_select":
-            self.dismiss()
-        elif option_id == "action_hide":
-            self._hide_highlighted_pane()
-        elif option_id == "action_unhide":
-            self._unhide_highlighted_pane()
-        elif option_id == "action_hide_all":
-            self.app_ref.action_hide_all_children()
-            self.dismiss()
-        elif option_id == "action_show_all":
-            self.app_ref.action_show_all_children()
-            self.dismiss()
-        elif option_id == "action_reset":
-            self.app_ref.action_reset_layout()
-            self.dismiss()
+        handler = self._action_handlers.get(option_id)
+        if handler:
+            handler()
+        elif option_id in self._pane_by_option_id:
+            self._handle_pane_selection(self._pane_by_option_id[option_id])
+
+    def _run_root_action(self, action):
+        """Run a root-level app action and close the menu."""
+        action()
+        self.dismiss()
 
     def _find_pane_by_id(self, option_id):
         """Find pane by option ID."""
-        for pane, _ in self.app_ref._get_pane_list():
-            pane_id = pane.id if hasattr(pane, 'id') else str(id(pane))
-            if f"pane_{pane_id}" == option_id:
-                return pane
-        return None
+        return self._pane_by_option_id.get(option_id)
 
     def _handle_pane_selection(self, pane):
         """Handle pane selection from menu."""
@@ -176,6 +200,8 @@ class PaneMenuScreen(ModalScreen):
         if is_hidden:
             # Unhide
             pane.styles.display = "block"
+            option_list = self.query_one("#menu-options", OptionList)
+            self._refresh_pane_option(option_list, option_list.highlighted, pane)
             self.app_ref.notify(f"Unhidden: {self.app_ref._get_pane_name(pane)}", severity="information")
         else:
             # Focus the pane
@@ -187,13 +213,11 @@ class PaneMenuScreen(ModalScreen):
         option_list = self.query_one("#menu-options", OptionList)
         highlighted_option = option_list.get_option_at_index(option_list.highlighted)
 
-        if highlighted_option and highlighted_option.id and highlighted_option.id.startswith("pane_"):
+        if highlighted_option and highlighted_option.id in self._pane_by_option_id:
             pane = self._find_pane_by_id(highlighted_option.id)
             if pane and pane.styles.display != "none":
                 pane.styles.display = "none"
-                # Refresh the menu
-                self.dismiss()
-                self.app_ref.action_show_pane_menu()
+                self._refresh_pane_option(option_list, option_list.highlighted, pane)
             elif pane and pane.styles.display == "none":
                 self.app_ref.notify("Pane is already hidden", severity="warning")
 
@@ -202,13 +226,11 @@ class PaneMenuScreen(ModalScreen):
         option_list = self.query_one("#menu-options", OptionList)
         highlighted_option = option_list.get_option_at_index(option_list.highlighted)
 
-        if highlighted_option and highlighted_option.id and highlighted_option.id.startswith("pane_"):
+        if highlighted_option and highlighted_option.id in self._pane_by_option_id:
             pane = self._find_pane_by_id(highlighted_option.id)
             if pane and pane.styles.display == "none":
                 pane.styles.display = "block"
-                # Refresh the menu
-                self.dismiss()
-                self.app_ref.action_show_pane_menu()
+                self._refresh_pane_option(option_list, option_list.highlighted, pane)
             elif pane and pane.styles.display != "none":
                 self.app_ref.notify("Pane is already visible", severity="warning")
 
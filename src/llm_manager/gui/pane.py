@@ -1,6 +1,10 @@
 """Pane widget for LLM Manager."""
 
+import asyncio
+import contextlib
+import os
 import subprocess
+import sys
 import tempfile
 from pathlib import Path
 from textual.app import ComposeResult
@@ -12,45 +16,102 @@ from textual.reactive import reactive
 from textual import events
 from rich.text import Text
 
-
-class EditableTextArea(TextArea):
+from .css_cache import CachedDefaultCSS
+
+# Seconds to wait after a save request so bursts of saves coalesce into one write
+SAVE_DEBOUNCE_SECONDS = 0.2
+
+# RAM-backed directory for editor round-trips, when the platform has one
+_TMPFS_DIR = "/dev/shm" if sys.platform.startswith("linux") and os.path.isdir("/dev/shm") else None
+
+# Last known content of each storage file, keyed by path: (mtime_ns, size, content)
+_PANE_CONTENT_CACHE: dict[str, tuple[int, int, str]] = {}
+# Files larger than this are re-read rather than kept in the cache
+_PANE_CACHE_MAX_SIZE = 64 * 1024
+
+# Shared stylesheet for EditablePane and any subclasses
+_PANE_CSS = """
+EditablePane {
+    border: solid $primary;
+    height: 1fr;
+    margin: 1;
+}
+
+EditablePane:focus {
+    border: heavy $accent;
+}
+
+EditablePane.pane-focused {
+    border: heavy $accent;
+}
+
+EditablePane .pane-title {
+    background: $primary;
+    color: $text;
+    text-align: center;
+    padding: 0 1;
+}
+
+EditablePane:focus .pane-title {
+    background: $accent;
+    color: $text;
+}
+
+EditablePane.pane-focused .pane-title {
+    background: $accent;
+    color: $text;
+}
+
+EditablePane .pane-content {
+    height: 1fr;
+}
+
+EditablePane TextArea {
+    height: 1fr;
+    margin: 0 1;
+}
+
+EditablePane .pane-footer {
+    background: $surface;
+    color: $text-muted;
+    text-align: center;
+    padding: 0 1;
+}
+"""
+
+
+class EditableTextArea(TextArea, can_focus=True):
     """Custom TextArea that handles ESC key to exit edit mode."""
 
+    def __init__(self, *args, pane: "EditablePane", **kwargs):
+        """Initialize the text area.
+
+        Args:
+            pane: The EditablePane that owns this text area
+            *args: Positional arguments passed to TextArea
+            **kwargs: Keyword arguments passed to TextArea
+        """
+        super().__init__(*args, **kwargs)
+        self._pane = pane
+
     def on_focus(self) -> None:
         """When TextArea gains focus (via mouse or otherwise), enter edit mode."""
-        # Find parent EditablePane and ensure edit_mode is set
-        parent = self.parent
-        while parent is not None:
-            if hasattr(parent, 'edit_mode') and hasattr(parent, 'enter_edit_mode'):
-                if not parent.edit_mode:
-                    # Set edit mode flag without calling focus again (avoid recursion)
-                    parent.edit_mode = True
-                    parent._update_footer()
-                return
-            parent = parent.parent
-        # Call parent's on_focus
-        super().on_focus()
+        if not self._pane.edit_mode:
+            self._pane.enter_edit_mode()
 
     def _on_key(self, event: events.Key) -> None:
         """Handle key events, with ESC exiting edit mode."""
         if event.key == "escape":
-            # Find parent with exit_edit_mode method and call it
-            parent = self.parent
-            while parent is not None:
-                if hasattr(parent, 'exit_edit_mode') and hasattr(parent, 'edit_mode'):
-                    # Always try to exit edit mode when ESC is pressed
-                    parent.exit_edit_mode()
-                    event.prevent_default()
-                    event.stop()
-                    return
-                parent = parent.parent
-            # If no parent found, just return
+            # Always try to exit edit mode when ESC is pressed
+            self._pane.exit_edit_mode()
+            event.prevent_default()
+            event.stop()
             return
         # For all other keys, call the parent TextArea's handler
         super()._on_key(event)
 
 
-class EditablePane(Container, can_focus=True):
+class EditablePane(CachedDefaultCSS, Container, can_focus=True):
     """A pane that displays content and can be edited with nvim."""
 
     BINDINGS = [
@@ -58,80 +119,40 @@ class EditablePane(Container, can_focus=True):
         Binding("c", "clear_content", "Clear", show=False),
     ]
 
-    DEFAULT_CSS = """
-    EditablePane {
-        border: solid $primary;
-        height: 1fr;
-        margin: 1;
-    }
-
-    EditablePane:focus {
-        border: heavy $accent;
-    }
-
-    EditablePane.pane-focused {
-        border: heavy $accent;
-    }
-
-    EditablePane .pane-title {
-        background: $primary;
-        color: $text;
-        text-align: center;
-        padding: 0 1;
-    }
-
-    EditablePane:focus .pane-title {
-        background: $accent;
-        color: $text;
-    }
-
-    EditablePane.pane-focused .pane-title {
-        background: $accent;
-        color: $text;
-    }
-
-    EditablePane .pane-content {
-        height: 1fr;
-    }
+    # Footer text for each mode
+    _FOOTER_EDIT = "-- EDIT MODE -- | ESC: Command mode | Ctrl+S: Save"
+    _FOOTER_COMMAND = "i: Edit mode | e: nvim | c: clear | Ctrl+S: Save"
 
-    EditablePane TextArea {
-        height: 1fr;
-        margin: 0 1;
+    # Mode-switch keys handled in on_key, keyed by (edit_mode, key)
+    _KEY_DISPATCH = {
+        (False, "i"): "enter_edit_mode",  # In command mode, 'i' enters edit mode
+        (True, "escape"): "exit_edit_mode",  # ESC in edit mode exits to command mode
     }
 
-    EditablePane .pane-footer {
-        background: $surface;
-        color: $text-muted;
-        text-align: center;
-        padding: 0 1;
-    }
-    """
+    DEFAULT_CSS = _PANE_CSS
 
     @property
     def content(self) -> str:
         """Get the current content from the TextArea."""
-        try:
-            content_widget = self.query_one(f"#{self.id}-content", TextArea)
-            return content_widget.text
-        except Exception:
-            # If TextArea not yet mounted, return empty string
+        if not self._mounted:
+            # TextArea not yet mounted
             return ""
+        return self._content_widget.text
 
     @content.setter
     def content(self, value: str) -> None:
         """Set the content in the TextArea."""
-        try:
-            content_widget = self.query_one(f"#{self.id}-content", TextArea)
-            content_widget.load_text(value)
-        except Exception:
-            # If TextArea not yet mounted, ignore
-            pass
+        if not self._mounted:
+            # TextArea not yet mounted, ignore
+            return
+        self._content_widget.load_text(value)
 
     def __init__(
         self,
         title: str,
         storage_path: Path,
         editor: str = "nvim",
+        load_on_mount: bool = True,
         name: str | None = None,
         id: str | None = None,
         classes: str | None = None,
@@ -142,6 +163,8 @@ class EditablePane(Container, can_focus=True):
             title: Display title for the pane
             storage_path: Path where pane content is persisted
             editor: Editor command to use (default: nvim)
+            load_on_mount: Load content synchronously on mount; when False the
+                owner is expected to call load_content_in_thread
             name: Widget name
             id: Widget ID
             classes: CSS classes
@@ -150,45 +173,95 @@ class EditablePane(Container, can_focus=True):
         self.title_text = title
         self.storage_path = storage_path
         self.editor = editor
+        self.load_on_mount = load_on_mount
+        # Child ids and selectors, built once rather than on every lookup
+        self._content_id = f"{id}-content"
+        self._footer_id = f"{id}-footer"
+        self._content_sel = f"#{self._content_id}"
+        self._footer_sel = f"#{self._footer_id}"
         self.is_docked = True
         self.edit_mode = False  # Track edit vs command mode
 
+        # Child widgets, cached in compose to avoid DOM queries on hot paths
+        self._content_widget: TextArea | None = None
+        self._footer_widget: Label | None = None
+        self._last_footer: str | None = None
+        self._mounted = False
+        # Content has been loaded from storage; until then saves are refused
+        # so an empty TextArea can't overwrite the file
+        self._loaded = False
+
+        # Latest content waiting to be written by the autosave worker
+        self._pending_save: str | None = None
+        self._save_requested = asyncio.Event()
+        self._announce_save = False  # Notify once the pending save is written
+        self._dir_created = False
+        # (content hash, mtime_ns, size) of the file as this pane last read or wrote it
+        self._last_saved: tuple[int, int, int] | None = None
+
     def compose(self) -> ComposeResult:
         """Compose the pane widget."""
         yield Label(self.title_text, classes="pane-title")
-        text_area = EditableTextArea("", id=f"{self.id}-content", classes="pane-content")
-        text_area.can_focus = True
-        yield text_area
-        yield Label(
-            "i: Edit mode | e: nvim | c: clear | Ctrl+S: Save",
+        text_area = EditableTextArea(
+            "", pane=self, id=self._content_id, classes="pane-content"
+        )
+        footer = Label(
+            self._FOOTER_COMMAND,
             classes="pane-footer",
-            id=f"{self.id}-footer"
+            id=self._footer_id
         )
+        self._content_widget = text_area
+        self._footer_widget = footer
+        yield text_area
+        yield footer
 
     def on_mount(self) -> None:
         """Load content when pane is mounted."""
-        self.load_content()
+        # Children are mounted before the parent's Mount event
+        self._mounted = True
         # Start in command mode
         self.edit_mode = False
-        self._update_footer()
+        if self.load_on_mount:
+            self.load_content()
+            self._update_footer()
+        else:
+            # Ignore typing until the threaded load fills the editor
+            self._content_widget.read_only = True
+            self._footer_widget.update("Loading…")
+            self._last_footer = None
+        self.run_worker(self._drain_saves(), exclusive=True, group="autosave")
+
+    def on_unmount(self) -> None:
+        """Flush any save still waiting on the debounce before the pane goes away."""
+        self._mounted = False
+        if self._pending_save is not None:
+            content, self._pending_save = self._pending_save, None
+            try:
+                self._write_storage(content)
+            except Exception:
+                # The app is shutting down; there is nowhere left to report to
+                pass
 
     def on_focus(self) -> None:
         """Handle focus event."""
-        self.add_class("pane-focused")
+        if not self.has_class("pane-focused"):
+            self.add_class("pane-focused")
         # Ensure we stay in command mode when pane gets focus
         if not self.edit_mode:
             # Check if TextArea somehow got focus and unfocus it
-            try:
-                content_widget = self.query_one(f"#{self.id}-content", TextArea)
-                if content_widget.has_focus:
-                    # Call focus on self but use call_later to avoid recursion
-                    self.app.call_later(lambda: self.focus() if not self.edit_mode else None)
-            except Exception:
-                pass
+            if self._mounted and self._content_widget.has_focus:
+                # Refocus self after the next refresh to avoid recursion
+                self.app.call_after_refresh(self._refocus_if_command)
+
+    def _refocus_if_command(self) -> None:
+        """Take focus back from the TextArea if still in command mode."""
+        if not self.edit_mode:
+            self.focus()
 
     def on_blur(self) -> None:
         """Handle blur event."""
-        self.remove_class("pane-focused")
+        if self.has_class("pane-focused"):
+            self.remove_class("pane-focused")
         # Don't automatically exit edit mode here - let user press ESC to exit
         # This avoids timing issues with focus changes
 
@@ -196,12 +269,9 @@ class EditablePane(Container, can_focus=True):
         """Enter edit mode - focus the TextArea for typing."""
         if not self.edit_mode:
             self.edit_mode = True
-            try:
-                content_widget = self.query_one(f"#{self.id}-content", TextArea)
-                content_widget.focus()
+            if self._mounted:
+                self._content_widget.focus()
                 self._update_footer()
-            except Exception:
-                pass
 
     def exit_edit_mode(self) -> None:
         """Exit edit mode - return to command mode."""
@@ -212,25 +282,20 @@ class EditablePane(Container, can_focus=True):
 
     def _update_footer(self) -> None:
         """Update footer to show current mode."""
-        try:
-            footer = self.query_one(f"#{self.id}-footer", Label)
-            if self.edit_mode:
-                footer.update("-- EDIT MODE -- | ESC: Command mode | Ctrl+S: Save")
-            else:
-                footer.update("i: Edit mode | e: nvim | c: clear | Ctrl+S: Save")
-        except Exception:
-            pass
+        if not self._mounted:
+            return
+        new = self._FOOTER_EDIT if self.edit_mode else self._FOOTER_COMMAND
+        # Skip the widget refresh when the mode hasn't changed
+        if new is self._last_footer:
+            return
+        self._footer_widget.update(new)
+        self._last_footer = new
 
     def on_key(self, event) -> None:
         """Handle key events."""
-        # In command mode, 'i' enters edit mode
-        if not self.edit_mode and event.key == "i":
-            self.enter_edit_mode()
-            event.prevent_default()
-            event.stop()
-        # ESC in edit mode exits to command mode
-        elif self.edit_mode and event.key == "escape":
-            self.exit_edit_mode()
+        action = self._KEY_DISPATCH.get((self.edit_mode, event.key))
+        if action:
+            getattr(self, action)()
             event.prevent_default()
             event.stop()
 
@@ -247,70 +312,176 @@ class EditablePane(Container, can_focus=True):
 
     def clear_content(self) -> None:
         """Clear the content of the pane (display only, does not save to disk)."""
-        try:
-            content_widget = self.query_one(f"#{self.id}-content", TextArea)
-            content_widget.load_text("")
-            self.app.notify(f"{self.title_text} cleared", severity="information")
-        except Exception as e:
-            self.app.notify(f"Error clearing content: {e}", severity="error")
+        if not self._mounted:
+            return
+        self._content_widget.load_text("")
+        self.app.notify(f"{self.title_text} cleared", severity="information")
 
     def load_content(self) -> None:
         """Load content from storage."""
         try:
-            if self.storage_path.exists():
-                content_text = self.storage_path.read_text(encoding="utf-8")
-            else:
-                content_text = ""
+            content_text = self._read_storage()
+            self._loaded = True
+        except Exception as e:
+            content_text = f"Error loading content: {e}"
+
+        self._content_widget.load_text(content_text)
+        if self._loaded:
+            self._content_widget.read_only = False
 
-            content_widget = self.query_one(f"#{self.id}-content", TextArea)
-            content_widget.load_text(content_text)
+    async def load_content_in_thread(self) -> None:
+        """Load content from storage in a worker thread, then leave the loading state."""
+        try:
+            content_text = await asyncio.to_thread(self._read_storage)
+            loaded = True
         except Exception as e:
-            content_widget = self.query_one(f"#{self.id}-content", TextArea)
-            content_widget.load_text(f"Error loading content: {e}")
+            content_text = f"Error loading content: {e}"
+            loaded = False
+
+        self._content_widget.load_text(content_text)
+        self._loaded = loaded
+        self._content_widget.read_only = not loaded
+        self._update_footer()
 
-    def save_content(self) -> bool:
-        """Save content to storage.
+    def _read_storage(self) -> str:
+        """Read the stored content, or an empty string if nothing is stored yet.
 
-        Returns:
-            True if successful, False otherwise
+        Small files are cached per path and only re-read when the file's
+        mtime or size changes.
         """
         try:
-            content_widget = self.query_one(f"#{self.id}-content", TextArea)
-            current_content = content_widget.text
+            stat = self.storage_path.stat()
+        except FileNotFoundError:
+            return ""
+        file_key = (stat.st_mtime_ns, stat.st_size)
 
-            self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-            self.storage_path.write_text(current_content, encoding="utf-8")
-            return True
-        except Exception as e:
-            self.app.notify(f"Error saving: {e}", severity="error")
+        # Reuse the cached content unless the file changed since it was read
+        cached = _PANE_CONTENT_CACHE.get(str(self.storage_path))
+        if cached is not None and cached[:2] == file_key:
+            content = cached[2]
+        else:
+            content = self.storage_path.read_bytes().decode("utf-8")
+            self._cache_content(file_key, content)
+        self._last_saved = (hash(content), *file_key)
+        return content
+
+    def save_content(self, announce: bool = False) -> bool:
+        """Queue the current content to be saved to storage.
+
+        The write happens on the autosave worker after a short debounce, so
+        repeated saves in quick succession result in a single write of the
+        latest content.
+
+        Args:
+            announce: Notify "saved" once the write has succeeded
+
+        Returns:
+            True if the save was queued, False if the pane is not mounted or
+            its content has not been loaded
+        """
+        if not self._mounted:
+            return False
+        if not self._loaded:
+            self.app.notify(f"{self.title_text} has not finished loading", severity="warning")
             return False
+        self._pending_save = self._content_widget.text
+        self._announce_save = self._announce_save or announce
+        self._save_requested.set()
+        return True
+
+    async def _drain_saves(self) -> None:
+        """Write queued saves to storage off the UI thread, coalescing bursts."""
+        while True:
+            await self._save_requested.wait()
+            await asyncio.sleep(SAVE_DEBOUNCE_SECONDS)
+            self._save_requested.clear()
+            content, self._pending_save = self._pending_save, None
+            announce, self._announce_save = self._announce_save, False
+            if content is None:
+                continue
+            try:
+                await asyncio.to_thread(self._write_storage, content)
+            except Exception as e:
+                self.app.notify(f"Error saving: {e}", severity="error")
+            else:
+                if announce:
+                    self.app.notify(f"{self.title_text} saved", severity="information")
+
+    def _write_storage(self, content: str) -> None:
+        """Atomically write content to storage, skipping unchanged content.
+
+        The content is written to a sibling temporary file and moved into
+        place with os.replace, so a crash mid-write never leaves a truncated
+        pane file behind. The write is only skipped when the content matches
+        the last save and the file is still the one that save left behind.
+        """
+        content_hash = hash(content)
+        if self._last_saved is not None and self._last_saved[0] == content_hash:
+            try:
+                stat = self.storage_path.stat()
+            except FileNotFoundError:
+                stat = None
+            if stat is not None and self._last_saved[1:] == (stat.st_mtime_ns, stat.st_size):
+                return
+        if not self._dir_created:
+            self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+            self._dir_created = True
+        tmp_path = self.storage_path.with_suffix(self.storage_path.suffix + ".tmp")
+        tmp_path.write_bytes(content.encode("utf-8"))
+        os.replace(tmp_path, self.storage_path)
+        stat = self.storage_path.stat()
+        self._last_saved = (content_hash, stat.st_mtime_ns, stat.st_size)
+        self._cache_content((stat.st_mtime_ns, stat.st_size), content)
+
+    def _cache_content(self, file_key: tuple[int, int], content: str) -> None:
+        """Remember the content of the storage file, unless it is large.
+
+        Args:
+            file_key: (mtime_ns, size) of the file holding the content
+            content: The file content
+        """
+        key = str(self.storage_path)
+        if file_key[1] > _PANE_CACHE_MAX_SIZE:
+            _PANE_CONTENT_CACHE.pop(key, None)
+        else:
+            _PANE_CONTENT_CACHE[key] = (*file_key, content)
 
     def edit_with_nvim(self) -> None:
         """Open content in nvim for editing."""
         # Get current content from TextArea
-        content_widget = self.query_one(f"#{self.id}-content", TextArea)
+        content_widget = self._content_widget
         current_content = content_widget.text
 
-        # Create a temporary file with current content
+        # Create a temporary file with current content, on tmpfs where available
         with tempfile.NamedTemporaryFile(
-            mode="w",
+            mode="wb",
             suffix=".txt",
+            dir=_TMPFS_DIR,
             delete=False,
-            encoding="utf-8"
         ) as tmp_file:
-            tmp_file.write(current_content)
+            tmp_file.write(current_content.encode("utf-8"))
+            tmp_file.flush()
+            stat_before = os.fstat(tmp_file.fileno())
             tmp_path = tmp_file.name
 
         try:
             # Suspend the Textual app
             with self.app.suspend():
-                # Open nvim with the temporary file
-                result = subprocess.run([self.editor, tmp_path])
+                # Open nvim with the temporary file. Python creates descriptors
+                # non-inheritable (PEP 446), so skipping the close-all-fds loop
+                # leaks nothing into the editor while speeding up the launch.
+                result = subprocess.run([self.editor, tmp_path], close_fds=False)
 
                 if result.returncode == 0:
+                    # Skip the read-back entirely if the editor never wrote the file
+                    stat_after = os.stat(tmp_path)
+                    if (stat_after.st_mtime_ns, stat_after.st_size) == (
+                        stat_before.st_mtime_ns, stat_before.st_size
+                    ):
+                        return
+
                     # Read back the edited content
-                    with open(tmp_path, "r", encoding="utf-8") as f:
-                        new_content = f.read()
+                    new_content = Path(tmp_path).read_bytes().decode("utf-8")
 
                     # Update content if changed
                     if new_content != current_content:
@@ -323,7 +494,8 @@ class EditablePane(Container, can_focus=True):
             self.app.notify(f"Error opening editor: {e}", severity="error")
         finally:
             # Clean up temporary file
-            Path(tmp_path).unlink(missing_ok=True)
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp_path)
 
     def toggle_dock(self) -> None:
         """Toggle the docked state of the pane."""
@@ -1,90 +1,117 @@
 """Prompt file manager screen for loading and saving prompts."""
 
-from pathlib import Path
+import os
+from textual import work
 from textual.app import ComposeResult
 from textual.screen import ModalScreen
 from textual.containers import Container, Vertical
 from textual.widgets import Label, OptionList, Input, Button
 from textual.widgets.option_list import Option
+from textual.worker import get_current_worker
 from rich.text import Text
 
 from ..core.settings import settings
-
-
-class PromptManagerScreen(ModalScreen[dict]):
-    """Modal screen for managing prompt files (load/save)."""
-
-    DEFAULT_CSS = """
-    PromptManagerScreen {
-        align: center middle;
-    }
-
-    #prompt-manager-dialog {
-        width: 70;
-        height: auto;
-        max-height: 80%;
-        background: $surface;
-        border: heavy $primary;
-        padding: 1 2;
-    }
-
-    #prompt-manager-title,
-    #list-title,
-    #load-title,
-    #save-title {
-        background: $primary;
-        color: $text;
-        text-align: center;
-        padding: 1;
-        margin-bottom: 1;
-    }
-
-    #prompt-manager-options,
-    #list-options,
-    #load-options {
-        height: auto;
-        max-height: 25;
-        border: solid $surface;
-        margin: 1 0;
-    }
-
-    #prompt-manager-status,
-    #list-status,
-    #load-status,
-    #save-status {
-        background: $surface;
-        color: $text-muted;
-        text-align: center;
-        padding: 1;
-        margin-top: 1;
-    }
-
-    .input-container {
-        height: auto;
-        padding: 1;
-        margin: 1 0;
-    }
-
-    .input-label {
-        margin-bottom: 1;
-    }
-
-    Input {
-        margin-bottom: 1;
-    }
-
-    #button-container,
-    #save-button-container {
-        height: auto;
-        align: center middle;
-    }
-
-    #button-container Button,
-    #save-button-container Button {
-        margin: 0 1;
-    }
+from .css_cache import CachedDefaultCSS
+
+# Bytes read from each prompt file to build its list preview
+PREVIEW_READ_BYTES = 64
+
+# Files larger than this are listed without opening them for a preview
+PREVIEW_MAX_FILE_SIZE = 1024 * 1024
+
+# Number of prompt options pushed to the list at a time while it populates
+LIST_BATCH_SIZE = 32
+
+# Option label templates, bound once: (filename, preview, size) and (filename, size)
+_LIST_LABEL = "📄 {:30} | {:18} ({} bytes)".format
+_LOAD_LABEL = "📥 {:40} ({} bytes)".format
+
+# Insertion mode for each single-key shortcut on the load mode screen
+_LOAD_MODE_KEYS = {"r": "replace", "a": "append", "i": "insert"}
+
+
+# Stylesheet for PromptManagerScreen, built once at import
+_PROMPT_MANAGER_CSS = """
+PromptManagerScreen {
+    align: center middle;
+}
+
+#prompt-manager-dialog {
+    width: 70;
+    height: auto;
+    max-height: 80%;
+    background: $surface;
+    border: heavy $primary;
+    padding: 1 2;
+}
+
+#prompt-manager-title,
+#list-title,
+#load-title,
+#save-title {
+    background: $primary;
+    color: $text;
+    text-align: center;
+    padding: 1;
+    margin-bottom: 1;
+}
+
+#prompt-manager-options,
+#list-options,
+#load-options {
+    height: auto;
+    max-height: 25;
+    border: solid $surface;
+    margin: 1 0;
+}
+
+#prompt-manager-status,
+#list-status,
+#load-status,
+#save-status {
+    background: $surface;
+    color: $text-muted;
+    text-align: center;
+    padding: 1;
+    margin-top: 1;
+}
+
+.input-container {
+    height: auto;
+    padding: 1;
+    margin: 1 0;
+}
+
+.input-label {
+    margin-bottom: 1;
+}
+
+Input {
+    margin-bottom: 1;
+}
+
+#button-container,
+#save-button-container {
+    height: auto;
+    align: center middle;
+}
+
+#button-container Button,
+#save-button-container Button {
+    margin: 0 1;
+}
+"""
+
+
+class PromptManagerScreen(CachedDefaultCSS, ModalScreen[dict]):
+    """Modal screen for managing prompt files (load/save).
+
+    The screen is created anew every time it is opened, so its default CSS
+    is collected once through CachedDefaultCSS.
     """
 
+    DEFAULT_CSS = _PROMPT_MANAGER_CSS
+
     BINDINGS = [
         ("escape", "dismiss_cancel", "Cancel"),
         ("q", "dismiss_cancel", "Cancel"),
@@ -106,6 +133,42 @@ class PromptManagerScreen(ModalScreen[dict]):
         self.mode = "menu"  # menu, load, save, load_mode_select
         self.prompts_dir = settings.PROMPTS_DIR
         self.selected_filename = None  # Store selected file for load mode selection
+        # Previews already read this session, keyed by (path, size in bytes, mtime_ns)
+        self._previews: dict[tuple[str, int, int], str] = {}
+
+        # Static menus, built once and re-mounted on every visit; only one list
+        # holds them at a time since each screen change removes the previous one
+        self._menu_options = [
+            Option(Text("═══ Prompt Manager ═══", style="bold cyan"), disabled=True),
+            Option("📂 List Prompts", id="action_list"),
+            Option("📥 Load Prompt", id="action_load"),
+            Option("💾 Save Prompt", id="action_save"),
+            Option(Text("─────────────────────", style="dim"), disabled=True),
+            Option("❌ Cancel", id="action_cancel"),
+        ]
+        self._load_mode_options = [
+            Option(Text("═══ Choose Insertion Mode ═══", style="bold cyan"), disabled=True),
+            Option("🔄 [R] Replace current contents", id="mode_replace"),
+            Option("➕ [A] Append to current contents", id="mode_append"),
+            Option("📌 [I] Insert at cursor position", id="mode_insert"),
+            Option(Text("─────────────────────", style="dim"), disabled=True),
+            Option("⬅ Back", id="action_back"),
+        ]
+
+        # Option handlers keyed by (mode, option id); a mode of None matches any mode
+        self._dispatch = {
+            (None, "action_back"): self._show_menu,
+            (None, "action_cancel"): self.action_dismiss_cancel,
+            ("menu", "action_list"): self._show_prompt_list,
+            ("menu", "action_load"): self._show_load_screen,
+            ("menu", "action_save"): self._show_save_screen,
+        }
+        # Handlers for "<prefix>_<value>" option ids keyed by (mode, prefix)
+        self._prefix_dispatch = {
+            ("list", "file"): self._load_prompt,
+            ("load", "load"): self._load_prompt,
+            ("load_mode_select", "mode"): self._dismiss_load,
+        }
 
     def compose(self) -> ComposeResult:
         """Compose the prompt manager screen."""
@@ -115,87 +178,135 @@ class PromptManagerScreen(ModalScreen[dict]):
 
     def _compose_menu(self) -> ComposeResult:
         """Compose the main menu."""
-        options = []
-        options.append(Option(Text("═══ Prompt Manager ═══", style="bold cyan"), disabled=True))
-        options.append(Option("📂 List Prompts", id="action_list"))
-        options.append(Option("📥 Load Prompt", id="action_load"))
-        options.append(Option("💾 Save Prompt", id="action_save"))
-        options.append(Option(Text("─────────────────────", style="dim"), disabled=True))
-        options.append(Option("❌ Cancel", id="action_cancel"))
-
-        yield OptionList(*options, id="prompt-manager-options")
+        yield OptionList(*self._menu_options, id="prompt-manager-options")
         yield Label("↑/↓ Navigate | Enter Select | ESC/Q Cancel", id="prompt-manager-status")
 
-    def on_option_list_option_selected(self, event) -> None:
-        """Handle menu option selection."""
-        option_id = event.option.id
+    def _scan_prompts(self) -> list[tuple[str, int, int, str]]:
+        """Scan the prompts directory in a single pass.
 
-        if not option_id:
-            return
+        Rescanned on every visit, since editing a prompt in place doesn't
+        change the directory's mtime; previews are cached in _previews.
 
-        if option_id == "action_list":
-            self._show_prompt_list()
-        elif option_id == "action_load":
-            self._show_load_screen()
-        elif option_id == "action_save":
-            self._show_save_screen()
-        elif option_id == "action_cancel":
-            self.dismiss({"action": "cancel"})
+        Returns:
+            Sorted list of (filename, size in bytes, mtime_ns, path) for each .txt file
+        """
+        entries = []
+        with os.scandir(self.prompts_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".txt") and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((entry.name, stat.st_size, stat.st_mtime_ns, entry.path))
+        entries.sort(key=lambda entry: entry[0])
+        return entries
+
+    def _read_preview(self, path: str, size: int) -> str:
+        """Read a short single-line preview from the start of a prompt file.
 
-    def _show_prompt_list(self) -> None:
-        """Show list of available prompt files."""
-        # Get all .txt files from prompts directory
-        prompt_files = sorted(self.prompts_dir.glob("*.txt"))
+        Args:
+            path: Path of the prompt file
+            size: Size of the file in bytes
 
-        # Remove existing widgets properly
+        Returns:
+            First 15 characters with whitespace flattened, "..." if truncated
+        """
+        if size > PREVIEW_MAX_FILE_SIZE:
+            return "(large file)"
+        # Non-blocking so a FIFO swapped in after the scan can't stall the read
+        try:
+            fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+        except BlockingIOError:
+            return "(non-regular)"
+        try:
+            head = os.read(fd, PREVIEW_READ_BYTES)
+        except BlockingIOError:
+            return "(non-regular)"
+        finally:
+            os.close(fd)
+        content = head.decode("utf-8", "replace")
+        # Get first 15 chars, replace newlines/tabs with spaces
+        preview = content[:15].replace('\n', ' ').replace('\t', ' ').replace('\r', ' ')
+        if len(content) > 15:
+            preview += "..."
+        return preview
+
+    def _reset_dialog(self) -> Container:
+        """Remove the current dialog contents in one bulk removal.
+
+        Returns:
+            The emptied dialog container
+        """
         container = self.query_one("#prompt-manager-dialog", Container)
-        for child in list(container.children):
-            child.remove()
+        container.remove_children()
+        return container
 
-        container.mount(Label(f"{self.pane_name} - Available Prompts", id="list-title"))
+    def _show_prompt_list(self) -> None:
+        """Show list of available prompt files."""
+        container = self._reset_dialog()
 
-        options = []
-        options.append(Option(Text("═══ Available Prompts ═══", style="bold cyan"), disabled=True))
+        container.mount(Label(f"{self.pane_name} - Available Prompts", id="list-title"))
 
-        if prompt_files:
-            for prompt_file in prompt_files:
-                file_size = prompt_file.stat().st_size
-                # Read first 15 characters for preview
-                preview = ""
-                try:
-                    content = prompt_file.read_text(encoding="utf-8")
-                    # Get first 15 chars, replace newlines/tabs with spaces
-                    preview = content[:15].replace('\n', ' ').replace('\t', ' ').replace('\r', ' ')
-                    if len(content) > 15:
-                        preview += "..."
-                except Exception:
-                    preview = "[unreadable]"
+        # Mount the list right away; file entries are filled in by a worker
+        option_list = OptionList(
+            Option(Text("═══ Available Prompts ═══", style="bold cyan"), disabled=True),
+            id="list-options",
+        )
+        status = Label("Loading prompts…", id="list-status")
+        container.mount(option_list)
+        container.mount(status)
 
-                label = f"📄 {prompt_file.name:30} | {preview:18} ({file_size} bytes)"
-                options.append(Option(label, id=f"file_{prompt_file.name}"))
-        else:
-            options.append(Option(Text("No prompts found", style="dim italic"), disabled=True))
+        self.mode = "list"
 
-        options.append(Option(Text("─────────────────────", style="dim"), disabled=True))
-        options.append(Option("⬅ Back to Menu", id="action_back"))
+        # Focus the option list for keyboard navigation
+        option_list.focus()
 
-        container.mount(OptionList(*options, id="list-options"))
-        container.mount(Label("↑/↓ Navigate | Enter Select to Load | ESC Cancel", id="list-status"))
+        self._populate_list(option_list, status)
 
-        self.mode = "list"
+    @work(exclusive=True, thread=True)
+    def _populate_list(self, option_list: OptionList, status: Label) -> None:
+        """Scan prompts and read their previews off the UI thread.
 
-        # Focus the option list for keyboard navigation
-        self.query_one("#list-options", OptionList).focus()
+        Args:
+            option_list: The list to append prompt options to
+            status: Status label to restore once the list is complete
+        """
+        worker = get_current_worker()
+        # Get all .txt files from prompts directory
+        prompt_files = self._scan_prompts()
+
+        batch = []
+        for filename, file_size, mtime_ns, path in prompt_files:
+            if worker.is_cancelled:
+                return
+            # Read first 15 characters for preview, unless already read
+            preview_key = (path, file_size, mtime_ns)
+            preview = self._previews.get(preview_key)
+            if preview is None:
+                try:
+                    preview = self._read_preview(path, file_size)
+                except Exception:
+                    preview = "[unreadable]"
+                self._previews[preview_key] = preview
+
+            batch.append(Option(_LIST_LABEL(filename, preview, file_size), id=f"file_{filename}"))
+            if len(batch) >= LIST_BATCH_SIZE:
+                self.app.call_from_thread(option_list.add_options, batch)
+                batch = []
+
+        if not prompt_files:
+            batch.append(Option(Text("No prompts found", style="dim italic"), disabled=True))
+        batch.append(Option(Text("─────────────────────", style="dim"), disabled=True))
+        batch.append(Option("⬅ Back to Menu", id="action_back"))
+        self.app.call_from_thread(option_list.add_options, batch)
+        self.app.call_from_thread(
+            status.update, "↑/↓ Navigate | Enter Select to Load | ESC Cancel"
+        )
 
     def _show_load_screen(self) -> None:
         """Show screen for loading a prompt."""
         # Get all .txt files from prompts directory
-        prompt_files = sorted(self.prompts_dir.glob("*.txt"))
+        prompt_files = self._scan_prompts()
 
-        # Remove existing widgets properly
-        container = self.query_one("#prompt-manager-dialog", Container)
-        for child in list(container.children):
-            child.remove()
+        container = self._reset_dialog()
 
         container.mount(Label(f"{self.pane_name} - Load Prompt", id="load-title"))
 
@@ -203,30 +314,47 @@ class PromptManagerScreen(ModalScreen[dict]):
         options.append(Option(Text("═══ Select Prompt to Load ═══", style="bold cyan"), disabled=True))
 
         if prompt_files:
-            for prompt_file in prompt_files:
-                file_size = prompt_file.stat().st_size
-                label = f"📥 {prompt_file.name:40} ({file_size} bytes)"
-                options.append(Option(label, id=f"load_{prompt_file.name}"))
+            options += [
+                Option(_LOAD_LABEL(filename, file_size), id=f"load_{filename}")
+                for filename, file_size, _, _ in prompt_files
+            ]
         else:
             options.append(Option(Text("No prompts found", style="dim italic"), disabled=True))
 
         options.append(Option(Text("─────────────────────", style="dim"), disabled=True))
         options.append(Option("⬅ Back to Menu", id="action_back"))
 
-        container.mount(OptionList(*options, id="load-options"))
+        option_list = OptionList(id="load-options")
+        container.mount(option_list)
         container.mount(Label("↑/↓ Navigate | Enter Load | ESC Cancel", id="load-status"))
+        self._add_options_in_batches(option_list, options)
 
         self.mode = "load"
 
         # Focus the option list for keyboard navigation
-        self.query_one("#load-options", OptionList).focus()
+        option_list.focus()
+
+    def _add_options_in_batches(
+        self, option_list: OptionList, options: list[Option], start: int = 0
+    ) -> None:
+        """Feed options into a list one batch per refresh.
+
+        The first batch is added immediately so the visible part of the list
+        paints right away; the rest follow on subsequent refreshes.
+
+        Args:
+            option_list: The list to add options to
+            options: All options to add
+            start: Index of the first option not yet added
+        """
+        end = start + LIST_BATCH_SIZE
+        option_list.add_options(options[start:end])
+        if end < len(options):
+            self.call_after_refresh(self._add_options_in_batches, option_list, options, end)
 
     def _show_save_screen(self) -> None:
         """Show screen for saving a prompt."""
-        # Remove existing widgets properly
-        container = self.query_one("#prompt-manager-dialog", Container)
-        for child in list(container.children):
-            child.remove()
+        container = self._reset_dialog()
 
         container.mount(Label(f"{self.pane_name} - Save Prompt", id="save-title"))
 
@@ -295,22 +423,11 @@ class PromptManagerScreen(ModalScreen[dict]):
 
     def _show_load_mode_selection(self, filename: str) -> None:
         """Show insertion mode options for loading a prompt."""
-        # Remove existing widgets
-        container = self.query_one("#prompt-manager-dialog", Container)
-        for child in list(container.children):
-            child.remove()
+        container = self._reset_dialog()
 
         container.mount(Label(f"{self.pane_name} - Load: {filename}", id="load-mode-title"))
 
-        options = []
-        options.append(Option(Text("═══ Choose Insertion Mode ═══", style="bold cyan"), disabled=True))
-        options.append(Option("🔄 [R] Replace current contents", id="mode_replace"))
-        options.append(Option("➕ [A] Append to current contents", id="mode_append"))
-        options.append(Option("📌 [I] Insert at cursor position", id="mode_insert"))
-        options.append(Option(Text("─────────────────────", style="dim"), disabled=True))
-        options.append(Option("⬅ Back", id="action_back"))
-
-        container.mount(OptionList(*options, id="load-mode-options"))
+        container.mount(OptionList(*self._load_mode_options, id="load-mode-options"))
         container.mount(Label("R: Replace | A: Append | I: Insert | ESC: Cancel", id="load-mode-status"))
 
         self.mode = "load_mode_select"
@@ -320,9 +437,7 @@ class PromptManagerScreen(ModalScreen[dict]):
 
     def _show_menu(self) -> None:
         """Show the main menu."""
-        container = self.query_one("#prompt-manager-dialog", Container)
-        for child in list(container.children):
-            child.remove()
+        container = self._reset_dialog()
 
         container.mount(Label(f"{self.pane_name} - Prompt Manager", id="prompt-manager-title"))
         for widget in self._compose_menu():
@@ -349,37 +464,9 @@ class PromptManagerScreen(ModalScreen[dict]):
         """Handle keyboard shortcuts."""
         # Single key shortcuts for load mode selection
         if self.mode == "load_mode_select":
-            if event.key in ("r", "R"):
-                # Replace mode
-                file_path = self.prompts_dir / self.selected_filename
-                self.dismiss({
-                    "action": "load",
-                    "mode": "replace",
-                    "filename": self.selected_filename,
-                    "path": str(file_path)
-                })
-                event.prevent_default()
-                event.stop()
-            elif event.key in ("a", "A"):
-                # Append mode
-                file_path = self.prompts_dir / self.selected_filename
-                self.dismiss({
-                    "action": "load",
-                    "mode": "append",
-                    "filename": self.selected_filename,
-                    "path": str(file_path)
-                })
-                event.prevent_default()
-                event.stop()
-            elif event.key in ("i", "I"):
-                # Insert mode
-                file_path = self.prompts_dir / self.selected_filename
-                self.dismiss({
-                    "action": "load",
-                    "mode": "insert",
-                    "filename": self.selected_filename,
-                    "path": str(file_path)
-                })
+            mode = _LOAD_MODE_KEYS.get(event.key.lower())
+            if mode:
+                self._dismiss_load(mode)
                 event.prevent_default()
                 event.stop()
 
@@ -390,35 +477,36 @@ class PromptManagerScreen(ModalScreen[dict]):
         if not option_id:
             return
 
-        if option_id == "action_back":
-            self._show_menu()
-        elif option_id == "action_cancel":
-            self.dismiss({"action": "cancel"})
-        elif self.mode == "menu":
-            if option_id == "action_list":
-                self._show_prompt_list()
-            elif option_id == "action_load":
-                self._show_load_screen()
-            elif option_id == "action_save":
-                self._show_save_screen()
-        elif self.mode == "list":
-            # Load the selected file
-            if option_id.startswith("file_"):
-                filename = option_id[5:]  # Remove "file_" prefix
-                self._load_prompt(filename)
-        elif self.mode == "load":
-            # Load the selected file
-            if option_id.startswith("load_"):
-                filename = option_id[5:]  # Remove "load_" prefix
-                self._load_prompt(filename)
-        elif self.mode == "load_mode_select":
-            # Handle insertion mode selection
-            if option_id.startswith("mode_"):
-                mode = option_id[5:]  # Remove "mode_" prefix (replace, append, insert)
-                file_path = self.prompts_dir / self.selected_filename
-                self.dismiss({
-                    "action": "load",
-                    "mode": mode,
-                    "filename": self.selected_filename,
-                    "path": str(file_path)
-                })
+        # Exact ids first, then ids of the form "<prefix>_<value>"
+        handler = (
+            self._dispatch.get((None, option_id))
+            or self._dispatch.get((self.mode, option_id))
+        )
+        if handler is not None:
+            handler()
+            return
+
+        prefix, _, value = option_id.partition("_")
+        handler = self._prefix_dispatch.get((self.mode, prefix))
+        if handler is not None:
+            handler(value)
+
+    def _dismiss_load(self, mode: str) -> None:
+        """Dismiss with a load action for the selected file.
+
+        Args:
+            mode: Insertion mode (replace, append, insert)
+        """
+        file_path = self.prompts_dir / self.selected_filename
+        try:
+            content = file_path.read_text(encoding="utf-8")
+        except OSError:
+            # Let the caller report the missing file
+            content = None
+        self.dismiss({
+            "action": "load",
+            "mode": mode,
+            "filename": self.selected_filename,
+            "path": str(file_path),
+            "content": content,
+        })
@@ -4,68 +4,77 @@ from textual.app import ComposeResult
 from textual.containers import Container, Vertical, ScrollableContainer
 from textual.widgets import Static, Label
 from textual.reactive import reactive
+from textual.timer import Timer
 from rich.text import Text
 
 from ..core.settings import settings
 
+# Streaming display is refreshed once this many characters are pending...
+RENDER_FLUSH_CHARS = 256
+# ...or after this many seconds, whichever comes first (~30 Hz)
+RENDER_FLUSH_INTERVAL = 1 / 30
+
+
+# Stylesheet for ResponsePane, built once at import
+_RESPONSE_PANE_CSS = """
+ResponsePane {
+    border: solid $primary;
+    height: 1fr;
+    margin: 1;
+}
+
+ResponsePane:focus {
+    border: heavy $accent;
+}
+
+ResponsePane.pane-focused {
+    border: heavy $accent;
+}
+
+ResponsePane .pane-title {
+    background: $primary;
+    color: $text;
+    text-align: center;
+    padding: 0 1;
+}
+
+ResponsePane:focus .pane-title {
+    background: $accent;
+    color: $text;
+}
+
+ResponsePane.pane-focused .pane-title {
+    background: $accent;
+    color: $text;
+}
+
+ResponsePane .response-content {
+    padding: 1 2;
+    height: 1fr;
+    overflow-y: auto;
+}
+
+ResponsePane .pane-footer {
+    background: $surface;
+    color: $text-muted;
+    text-align: center;
+    padding: 0 1;
+}
+
+ResponsePane .status-bar {
+    background: $accent;
+    color: $text;
+    padding: 0 2;
+    height: 1;
+}
+"""
+
 
 class ResponsePane(Container, can_focus=True):
     """Pane for displaying LLM responses."""
 
-    DEFAULT_CSS = """
-    ResponsePane {
-        border: solid $primary;
-        height: 1fr;
-        margin: 1;
-    }
-
-    ResponsePane:focus {
-        border: heavy $accent;
-    }
-
-    ResponsePane.pane-focused {
-        border: heavy $accent;
-    }
-
-    ResponsePane .pane-title {
-        background: $primary;
-        color: $text;
-        text-align: center;
-        padding: 0 1;
-    }
-
-    ResponsePane:focus .pane-title {
-        background: $accent;
-        color: $text;
-    }
-
-    ResponsePane.pane-focused .pane-title {
-        background: $accent;
-        color: $text;
-    }
-
-    ResponsePane .response-content {
-        padding: 1 2;
-        height: 1fr;
-        overflow-y: auto;
-    }
-
-    ResponsePane .pane-footer {
-        background: $surface;
-        color: $text-muted;
-        text-align: center;
-        padding: 0 1;
-    }
-
-    ResponsePane .status-bar {
-        background: $accent;
-        color: $text;
-        padding: 0 2;
-        height: 1;
-    }
-    """
-
-    response_text = reactive("")
+    DEFAULT_CSS = _RESPONSE_PANE_CSS
+
     status = reactive("Ready")
     streaming_enabled = reactive(True)
 
@@ -85,6 +94,48 @@ class ResponsePane(Container, can_focus=True):
         super().__init__(name=name, id=id, classes=classes)
         self.streaming_enabled = settings.ENABLE_STREAMING
 
+        # Response is kept as appended chunks and joined on demand
+        self._chunks: list[str] = []
+        self._joined: str | None = ""
+        self._pending_chars = 0
+        self._flush_timer: Timer | None = None
+        self._scroll_pending = False
+        self._scroll_timer: Timer | None = None
+
+        # Child widgets, cached in compose to avoid DOM queries per token
+        self._title: Label | None = None
+        self._status_bar: Static | None = None
+        self._display: Static | None = None
+        self._scroll: ScrollableContainer | None = None
+
+    @property
+    def response_text(self) -> str:
+        """The full response text, joined once per change."""
+        if self._joined is None:
+            self._joined = "".join(self._chunks)
+        return self._joined
+
+    def _reset_text(self, text: str) -> None:
+        """Replace the response text and drop any pending display refresh.
+
+        Args:
+            text: The new response text
+        """
+        self._chunks = [text] if text else []
+        self._joined = text
+        self._pending_chars = 0
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+        self._stop_scroll_timer()
+
+    def _stop_scroll_timer(self) -> None:
+        """Stop the auto-scroll interval and forget any pending scroll."""
+        self._scroll_pending = False
+        if self._scroll_timer is not None:
+            self._scroll_timer.stop()
+            self._scroll_timer = None
+
     def compose(self) -> ComposeResult:
         """Compose the pane widget."""
         title_text = "Response"
@@ -93,11 +144,15 @@ class ResponsePane(Container, can_focus=True):
         else:
             title_text += " (Streaming OFF)"
 
-        yield Label(title_text, classes="pane-title", id="response-title")
-        yield Static(self.status, classes="status-bar", id="status-bar")
+        self._title = Label(title_text, classes="pane-title", id="response-title")
+        self._status_bar = Static(self.status, classes="status-bar", id="status-bar")
+        self._scroll = ScrollableContainer(classes="response-content")
+        self._display = Static("", id="response-display")
 
-        with ScrollableContainer(classes="response-content"):
-            yield Static("", id="response-display")
+        yield self._title
+        yield self._status_bar
+        with self._scroll:
+            yield self._display
 
         footer_text = "Press 's' to toggle streaming | 'c' to clear"
         yield Label(footer_text, classes="pane-footer")
@@ -117,14 +172,12 @@ class ResponsePane(Container, can_focus=True):
             status: Status message to display
         """
         self.status = status
-        status_bar = self.query_one("#status-bar", Static)
-        status_bar.update(status)
+        self._status_bar.update(status)
 
     def clear_response(self) -> None:
         """Clear the response display."""
-        self.response_text = ""
-        response_display = self.query_one("#response-display", Static)
-        response_display.update("")
+        self._reset_text("")
+        self._display.update("")
         self.set_status("Cleared")
 
     def set_response(self, text: str) -> None:
@@ -133,9 +186,8 @@ class ResponsePane(Container, can_focus=True):
         Args:
             text: The response text to display
         """
-        self.response_text = text
-        response_display = self.query_one("#response-display", Static)
-        response_display.update(Text(text))
+        self._reset_text(text)
+        self._display.update(Text(text))
 
     def append_response_chunk(self, chunk: str) -> None:
         """Append a chunk of streaming response.
@@ -143,13 +195,41 @@ class ResponsePane(Container, can_focus=True):
         Args:
             chunk: Text chunk to append
         """
-        self.response_text += chunk
-        response_display = self.query_one("#response-display", Static)
-        response_display.update(Text(self.response_text))
-
-        # Auto-scroll to bottom
-        container = self.query_one(ScrollableContainer)
-        container.scroll_end(animate=False)
+        self._chunks.append(chunk)
+        self._joined = None
+        self._pending_chars += len(chunk)
+
+        # Re-render once enough text has built up, otherwise on the next tick
+        if self._pending_chars >= RENDER_FLUSH_CHARS:
+            self._flush_display()
+        elif self._flush_timer is None:
+            self._flush_timer = self.set_timer(RENDER_FLUSH_INTERVAL, self._flush_display)
+
+    def _flush_display(self) -> None:
+        """Render the accumulated response and scroll to the bottom."""
+        self._pending_chars = 0
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+
+        self._display.update(Text(self.response_text))
+
+        # Auto-scroll to bottom, at most once per frame
+        self._scroll_pending = True
+        if self._scroll_timer is None:
+            self._scroll_timer = self.set_interval(RENDER_FLUSH_INTERVAL, self._flush_scroll)
+
+    def _flush_scroll(self) -> None:
+        """Scroll to the bottom if new text arrived, stopping once idle."""
+        if not self._scroll_pending:
+            self._stop_scroll_timer()
+            return
+        self._scroll_pending = False
+        self._scroll.scroll_end(animate=False)
+
+    def on_unmount(self) -> None:
+        """Stop the auto-scroll interval."""
+        self._stop_scroll_timer()
 
     def toggle_streaming(self) -> None:
         """Toggle streaming mode."""
@@ -157,11 +237,10 @@ class ResponsePane(Container, can_focus=True):
         settings.ENABLE_STREAMING = self.streaming_enabled
 
         # Update title
-        title = self.query_one("#response-title", Label)
         if self.streaming_enabled:
-            title.update("Response (Streaming ON)")
+            self._title.update("Response (Streaming ON)")
         else:
-            title.update("Response (Streaming OFF)")
+            self._title.update("Response (Streaming OFF)")
 
         mode = "ON" if self.streaming_enabled else "OFF"
         self.app.notify(f"Streaming: {mode}", severity="information")
@@ -172,10 +251,9 @@ class ResponsePane(Container, can_focus=True):
         Args:
             error: Error message to display
         """
-        self.response_text = ""
-        response_display = self.query_one("#response-display", Static)
+        self._reset_text("")
         error_text = Text(f"Error: {error}", style="bold red")
-        response_display.update(error_text)
+        self._display.update(error_text)
         self.set_status("Error")
 
     def get_response_text(self) -> str:
@@ -6,6 +6,31 @@ from textual.widgets import Static, Label
 from rich.text import Text
 
 
+# Stylesheet for RootPane, built once at import
+_ROOT_PANE_CSS = """
+RootPane {
+    height: 1fr;
+    border: solid $primary;
+}
+
+RootPane:focus {
+    border: heavy $accent;
+}
+
+#root-header {
+    background: $primary;
+    color: $text;
+    text-align: center;
+    height: 3;
+    padding: 1;
+}
+
+#root-content {
+    height: 1fr;
+}
+"""
+
+
 class RootPane(Container, can_focus=True):
     """Root container pane that manages all child panes in a true hierarchy.
 
@@ -13,28 +38,7 @@ class RootPane(Container, can_focus=True):
     It provides a visual tree display and root-level operations that affect all children.
     """
 
-    DEFAULT_CSS = """
-    RootPane {
-        height: 1fr;
-        border: solid $primary;
-    }
-
-    RootPane:focus {
-        border: heavy $accent;
-    }
-
-    #root-header {
-        background: $primary;
-        color: $text;
-        text-align: center;
-        height: 3;
-        padding: 1;
-    }
-
-    #root-content {
-        height: 1fr;
-    }
-    """
+    DEFAULT_CSS = _ROOT_PANE_CSS
 
     def __init__(self, child_panes_layout=None, name=None, id=None, classes=None):
         """Initialize the root pane container.
@@ -48,6 +52,7 @@ class RootPane(Container, can_focus=True):
         super().__init__(name=name, id=id, classes=classes)
         self.child_panes_layout = child_panes_layout
         self.child_panes = []  # Will store references to child panes
+        self._rows = []  # Layout row containers, cached on mount
 
     def compose(self) -> ComposeResult:
         """Compose the root pane with header and content area.
@@ -66,24 +71,30 @@ class RootPane(Container, can_focus=True):
             if self.child_panes_layout:
                 yield from self.child_panes_layout()
 
+    def on_mount(self) -> None:
+        """Cache the layout rows once the child layout is mounted."""
+        self._rows = list(self.query(".pane-row"))
+
     def hide_all_children(self) -> None:
         """Hide all child panes."""
-        for pane in self.child_panes:
-            pane.styles.display = "none"
+        with self.app.batch_update():
+            for pane in self.child_panes:
+                pane.styles.display = "none"
 
     def show_all_children(self) -> None:
         """Show all child panes."""
-        for pane in self.child_panes:
-            pane.styles.display = "block"
+        with self.app.batch_update():
+            for pane in self.child_panes:
+                pane.styles.display = "block"
 
     def reset_layout(self) -> None:
         """Reset all child panes to their default state."""
-        for pane in self.child_panes:
-            pane.styles.display = "block"
-            pane.remove_class("pane-minimized")
-
-        # Reset row heights
-        rows = self.query(".pane-row")
-        for row in rows:
-            row.styles.height = "1fr"
-            row.remove_class("row-hidden")
+        with self.app.batch_update():
+            for pane in self.child_panes:
+                pane.styles.display = "block"
+                pane.remove_class("pane-minimized")
+
+            # Reset row heights
+            for row in self._rows:
+                row.styles.height = "1fr"
+                row.remove_class("row-hidden")
@@ -1,10 +1,11 @@
 """Main entry point for LLM Manager application."""
 
-from llm_manager.gui.main_window import run_app
-
 
 def main():
     """Launch the LLM Manager GUI application."""
+    # Imported here so importing this module doesn't pull in Textual and the GUI
+    from llm_manager.gui.main_window import run_app
+
     run_app()
 
 
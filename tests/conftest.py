@@ -0,0 +1,57 @@
+"""Shared pytest fixtures."""
+
+import os
+import shutil
+import sys
+import tempfile
+import uuid
+from pathlib import Path
+
+import pytest
+
+# RAM-backed directory for test files, when the platform has one
+_TMPFS_DIR = "/dev/shm" if sys.platform.startswith("linux") and os.path.isdir("/dev/shm") else None
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory):
+    """Create one temporary directory for the whole test session.
+
+    It lives on tmpfs when available, so file round-trips stay in memory.
+    """
+    if _TMPFS_DIR is None:
+        yield tmp_path_factory.mktemp("llm_mgr")
+        return
+    path = Path(tempfile.mkdtemp(prefix="llm_mgr-", dir=_TMPFS_DIR))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture
+def shared_file(shared_tmp):
+    """Return a factory of file paths in shared_tmp, uniquely prefixed per test."""
+    prefix = uuid.uuid4().hex[:8]
+    return lambda name: shared_tmp / f"{prefix}-{name}"
+
+
+@pytest.fixture(scope="class")
+def app():
+    """Create one LLMManagerApp shared by the tests in a class, without running it."""
+    from llm_manager.gui.main_window import LLMManagerApp
+
+    app = LLMManagerApp()
+    yield app
+    app.pane_states.clear()
+    app.maximized_pane = None
+
+
+@pytest.fixture(scope="session")
+def app_probe():
+    """Return an LLMManagerApp that skips __init__, for tests of class attributes.
+
+    No widgets, CSS or Textual app state are set up, so only methods and
+    other class-level attributes can be used on it.
+    """
+    from llm_manager.gui.main_window import LLMManagerApp
+
+    return object.__new__(LLMManagerApp)
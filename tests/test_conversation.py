@@ -1,9 +1,7 @@
 """Tests for conversation history functionality."""
 
 import json
-import tempfile
-from pathlib import Path
-from datetime import datetime
+import threading
 import pytest
 
 from llm_manager.core.conversation import ConversationHistory, ConversationTurn
@@ -60,222 +58,350 @@ class TestConversationTurn:
         assert turn.user_prompt == "Hello"
 
 
-class TestConversationHistory:
-    """Test ConversationHistory class."""
-
-    def test_initialize_with_temp_file(self):
-        """Test initializing history with a temporary file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            history_file = Path(tmpdir) / "history.json"
-            history = ConversationHistory(history_file=history_file)
+@pytest.fixture(scope="module")
+def history_root(tmp_path_factory):
+    """Create one temporary directory shared by the history tests."""
+    return tmp_path_factory.mktemp("history")
 
-            assert history.history_file == history_file
-            assert history.turns == []
 
-    def test_add_turn(self):
-        """Test adding a conversation turn."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            history_file = Path(tmpdir) / "history.json"
-            history = ConversationHistory(history_file=history_file)
+@pytest.fixture
+def history_dir(history_root, request):
+    """Give each history test its own subdirectory of the shared root."""
+    path = history_root / request.node.name
+    path.mkdir()
+    return path
 
-            history.add_turn(
-                model="openai:gpt-4o",
-                user_prompt="Test prompt",
-                response="Test response",
-                system_prompt="System",
-                context="Context"
-            )
 
-            assert len(history.turns) == 1
-            assert history.turns[0].model == "openai:gpt-4o"
-            assert history.turns[0].user_prompt == "Test prompt"
-            assert history.turns[0].response == "Test response"
+@pytest.fixture
+def history(history_dir):
+    """Create an empty history stored in the test's directory."""
+    return ConversationHistory(history_file=history_dir / "history.json")
 
-    def test_add_turn_persists(self):
-        """Test that added turns are persisted to file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            history_file = Path(tmpdir) / "history.json"
-            history = ConversationHistory(history_file=history_file)
 
-            history.add_turn(
-                model="openai:gpt-4o",
-                user_prompt="Test",
-                response="Response"
-            )
+class TestConversationHistory:
+    """Test ConversationHistory class."""
 
-            # Verify file was created
-            assert history_file.exists()
+    def test_initialize_with_temp_file(self, history, history_dir):
+        """Test initializing history with a temporary file."""
+        assert history.history_file == history_dir / "history.json"
+        assert list(history.turns) == []
 
-            # Load and verify contents
-            with open(history_file, "r") as f:
-                data = json.load(f)
+    def test_add_turn(self, history):
+        """Test adding a conversation turn."""
+        history.add_turn(
+            model="openai:gpt-4o",
+            user_prompt="Test prompt",
+            response="Test response",
+            system_prompt="System",
+            context="Context"
+        )
 
-            assert len(data) == 1
-            assert data[0]["model"] == "openai:gpt-4o"
+        assert len(history.turns) == 1
+        assert history.turns[0].model == "openai:gpt-4o"
+        assert history.turns[0].user_prompt == "Test prompt"
+        assert history.turns[0].response == "Test response"
 
-    def test_get_recent_turns(self):
-        """Test getting recent conversation turns."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            history_file = Path(tmpdir) / "history.json"
-            history = ConversationHistory(history_file=history_file)
+    def test_add_turn_persists(self, history):
+        """Test that added turns are persisted to file."""
+        history.add_turn(
+            model="openai:gpt-4o",
+            user_prompt="Test",
+            response="Response"
+        )
+        history.flush()
 
-            # Add multiple turns
-            for i in range(5):
-                history.add_turn(
-                    model="openai:gpt-4o",
-                    user_prompt=f"Prompt {i}",
-                    response=f"Response {i}"
-                )
+        # Verify file was created
+        assert history.history_file.exists()
 
-            recent = history.get_recent_turns(count=3)
-            assert len(recent) == 3
-            assert recent[0].user_prompt == "Prompt 2"
-            assert recent[2].user_prompt == "Prompt 4"
+        # Load and verify contents (one JSON turn per line)
+        data = [json.loads(line) for line in history.history_file.read_bytes().splitlines()]
 
-    def test_clear_history(self):
-        """Test clearing conversation history."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            history_file = Path(tmpdir) / "history.json"
-            history = ConversationHistory(history_file=history_file)
+        assert len(data) == 1
+        assert data[0]["model"] == "openai:gpt-4o"
 
+    def test_get_recent_turns(self, history):
+        """Test getting recent conversation turns."""
+        # Add multiple turns
+        for i in range(5):
             history.add_turn(
                 model="openai:gpt-4o",
-                user_prompt="Test",
-                response="Response"
+                user_prompt=f"Prompt {i}",
+                response=f"Response {i}"
             )
 
-            assert len(history.turns) == 1
+        recent = history.get_recent_turns(count=3)
+        assert len(recent) == 3
+        assert recent[0].user_prompt == "Prompt 2"
+        assert recent[2].user_prompt == "Prompt 4"
+
+    def test_clear_history(self, history):
+        """Test clearing conversation history."""
+        history.add_turn(
+            model="openai:gpt-4o",
+            user_prompt="Test",
+            response="Response"
+        )
 
-            history.clear_history()
-            assert len(history.turns) == 0
+        assert len(history.turns) == 1
 
-    def test_export_json(self):
+        history.clear_history()
+        assert len(history.turns) == 0
+
+    def test_export_json(self, history, history_dir):
         """Test exporting history to JSON."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            history_file = Path(tmpdir) / "history.json"
-            export_file = Path(tmpdir) / "export.json"
-            history = ConversationHistory(history_file=history_file)
+        export_file = history_dir / "export.json"
 
-            history.add_turn(
-                model="openai:gpt-4o",
-                user_prompt="Test",
-                response="Response"
-            )
+        history.add_turn(
+            model="openai:gpt-4o",
+            user_prompt="Test",
+            response="Response"
+        )
 
-            success = history.export_to_file(export_file, format="json")
-            assert success
-            assert export_file.exists()
+        success = history.export_to_file(export_file, format="json")
+        assert success
+        assert export_file.exists()
 
-            # Verify exported contents
-            with open(export_file, "r") as f:
-                data = json.load(f)
+        # Verify exported contents
+        data = json.loads(export_file.read_bytes())
 
-            assert len(data) == 1
-            assert data[0]["user_prompt"] == "Test"
+        assert len(data) == 1
+        assert data[0]["user_prompt"] == "Test"
 
-    def test_export_text(self):
+    def test_export_text(self, history, history_dir):
         """Test exporting history to text."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            history_file = Path(tmpdir) / "history.json"
-            export_file = Path(tmpdir) / "export.txt"
-            history = ConversationHistory(history_file=history_file)
+        export_file = history_dir / "export.txt"
 
-            history.add_turn(
-                model="openai:gpt-4o",
-                user_prompt="Test prompt",
-                response="Test response",
-                system_prompt="System prompt",
-                context="Context"
-            )
+        history.add_turn(
+            model="openai:gpt-4o",
+            user_prompt="Test prompt",
+            response="Test response",
+            system_prompt="System prompt",
+            context="Context"
+        )
 
-            success = history.export_to_file(export_file, format="txt")
-            assert success
-            assert export_file.exists()
+        success = history.export_to_file(export_file, format="txt")
+        assert success
+        assert export_file.exists()
 
-            # Verify text contents
-            content = export_file.read_text()
-            assert "Test prompt" in content
-            assert "Test response" in content
-            assert "System prompt" in content
-            assert "Context" in content
+        # Verify text contents
+        content = export_file.read_text()
+        assert "Test prompt" in content
+        assert "Test response" in content
+        assert "System prompt" in content
+        assert "Context" in content
 
-    def test_import_from_file(self):
+    def test_import_from_file(self, history, history_dir):
         """Test importing history from JSON file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create export file
-            export_file = Path(tmpdir) / "export.json"
-            export_data = [
-                {
-                    "timestamp": "2024-01-01T12:00:00",
-                    "model": "openai:gpt-4o",
-                    "user_prompt": "Imported prompt",
-                    "system_prompt": "",
-                    "context": "",
-                    "response": "Imported response"
-                }
-            ]
+        # Create export file
+        export_file = history_dir / "export.json"
+        export_data = [
+            {
+                "timestamp": "2024-01-01T12:00:00",
+                "model": "openai:gpt-4o",
+                "user_prompt": "Imported prompt",
+                "system_prompt": "",
+                "context": "",
+                "response": "Imported response"
+            }
+        ]
+
+        with open(export_file, "w") as f:
+            json.dump(export_data, f)
+
+        # Import into the empty history
+        success = history.import_from_file(export_file)
+        assert success
+        assert len(history.turns) == 1
+        assert history.turns[0].user_prompt == "Imported prompt"
+
+    def test_max_history_items(self, history):
+        """Test that history respects max items limit."""
+        # Mock the max history items
+        from llm_manager.core import settings
+        original_max = settings.settings.MAX_HISTORY_ITEMS
+        settings.settings.MAX_HISTORY_ITEMS = 5
+        history.reload_settings()
+
+        try:
+            # Add more turns than the limit
+            for i in range(10):
+                history.add_turn(
+                    model="openai:gpt-4o",
+                    user_prompt=f"Prompt {i}",
+                    response=f"Response {i}"
+                )
 
-            with open(export_file, "w") as f:
-                json.dump(export_data, f)
+            # Should only keep last 5
+            assert len(history.turns) <= 5
+            assert history.turns[0].user_prompt == "Prompt 5"
+            assert history.turns[-1].user_prompt == "Prompt 9"
+        finally:
+            settings.settings.MAX_HISTORY_ITEMS = original_max
 
-            # Import into new history
-            history_file = Path(tmpdir) / "history.json"
-            history = ConversationHistory(history_file=history_file)
+    def test_load_existing_history(self, history_dir):
+        """Test loading existing history from file."""
+        history_file = history_dir / "history.json"
+
+        # Create existing history
+        existing_data = [
+            {
+                "timestamp": "2024-01-01T12:00:00",
+                "model": "openai:gpt-4o",
+                "user_prompt": "Existing",
+                "system_prompt": "",
+                "context": "",
+                "response": "Response"
+            }
+        ]
+
+        with open(history_file, "w") as f:
+            json.dump(existing_data, f)
+
+        # Load history
+        history = ConversationHistory(history_file=history_file)
+
+        assert len(history.turns) == 1
+        assert history.turns[0].user_prompt == "Existing"
+
+    def test_reload_keeps_latest_turns(self, history):
+        """Test that appended turns reload in order and respect max items."""
+        from llm_manager.core import settings
+        original_max = settings.settings.MAX_HISTORY_ITEMS
+        settings.settings.MAX_HISTORY_ITEMS = 5
+        history.reload_settings()
+
+        try:
+            for i in range(12):
+                history.add_turn(
+                    model="openai:gpt-4o",
+                    user_prompt=f"Prompt {i}",
+                    response=f"Response {i}"
+                )
+            history.flush()
 
-            success = history.import_from_file(export_file)
-            assert success
-            assert len(history.turns) == 1
-            assert history.turns[0].user_prompt == "Imported prompt"
+            # File is compacted well before it grows unbounded
+            lines = history.history_file.read_text().splitlines()
+            assert len(lines) <= 10
 
-    def test_max_history_items(self):
-        """Test that history respects max items limit."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            history_file = Path(tmpdir) / "history.json"
-            history = ConversationHistory(history_file=history_file)
+            reloaded = ConversationHistory(history_file=history.history_file)
+            assert [t.user_prompt for t in reloaded.turns] == [
+                f"Prompt {i}" for i in range(7, 12)
+            ]
+        finally:
+            settings.settings.MAX_HISTORY_ITEMS = original_max
 
-            # Mock the max history items
-            from llm_manager.core import settings
-            original_max = settings.settings.MAX_HISTORY_ITEMS
-            settings.settings.MAX_HISTORY_ITEMS = 5
-
-            try:
-                # Add more turns than the limit
-                for i in range(10):
-                    history.add_turn(
-                        model="openai:gpt-4o",
-                        user_prompt=f"Prompt {i}",
-                        response=f"Response {i}"
-                    )
-
-                # Should only keep last 5
-                assert len(history.turns) <= 5
-                assert history.turns[0].user_prompt == "Prompt 5"
-                assert history.turns[-1].user_prompt == "Prompt 9"
-            finally:
-                settings.settings.MAX_HISTORY_ITEMS = original_max
-
-    def test_load_existing_history(self):
-        """Test loading existing history from file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            history_file = Path(tmpdir) / "history.json"
-
-            # Create existing history
-            existing_data = [
-                {
-                    "timestamp": "2024-01-01T12:00:00",
-                    "model": "openai:gpt-4o",
-                    "user_prompt": "Existing",
-                    "system_prompt": "",
-                    "context": "",
-                    "response": "Response"
-                }
+    def test_reload_resumes_from_cursor(self, history_dir):
+        """Test that reloads seek past dropped turns and notice truncation."""
+        history_file = history_dir / "history.json"
+
+        from llm_manager.core import settings
+        original_max = settings.settings.MAX_HISTORY_ITEMS
+        settings.settings.MAX_HISTORY_ITEMS = 5
+
+        try:
+            history = ConversationHistory(history_file=history_file)
+            for i in range(8):
+                history.add_turn(
+                    model="openai:gpt-4o",
+                    user_prompt=f"Prompt {i}",
+                    response=f"Response {i}"
+                )
+                history.flush()
+
+            reloaded = ConversationHistory(history_file=history_file)
+            cursor = json.loads(reloaded.cursor_file.read_text())
+            assert cursor["offset"] > 0
+            assert cursor["skipped"] == 3
+
+            reloaded.add_turn(model="openai:gpt-4o", user_prompt="Prompt 8", response="")
+            reloaded.flush()
+            again = ConversationHistory(history_file=history_file)
+            assert [t.user_prompt for t in again.turns] == [
+                f"Prompt {i}" for i in range(4, 9)
             ]
 
-            with open(history_file, "w") as f:
-                json.dump(existing_data, f)
+            again.clear_history()
+            assert list(ConversationHistory(history_file=history_file).turns) == []
+        finally:
+            settings.settings.MAX_HISTORY_ITEMS = original_max
+
+    def test_reload_after_raising_limit(self, history_dir):
+        """Test that a cursor saved under a smaller limit is not reused."""
+        history_file = history_dir / "history.json"
 
-            # Load history
+        from llm_manager.core import settings
+        original_max = settings.settings.MAX_HISTORY_ITEMS
+        settings.settings.MAX_HISTORY_ITEMS = 5
+
+        try:
             history = ConversationHistory(history_file=history_file)
+            for i in range(8):
+                history.add_turn(model="openai:gpt-4o", user_prompt=f"P{i}", response="")
+                history.flush()
+            ConversationHistory(history_file=history_file)
+
+            settings.settings.MAX_HISTORY_ITEMS = 10
+            reloaded = ConversationHistory(history_file=history_file)
+            assert [t.user_prompt for t in reloaded.turns] == [f"P{i}" for i in range(8)]
+
+            settings.settings.MAX_HISTORY_ITEMS = 0
+            assert list(ConversationHistory(history_file=history_file).turns) == []
+        finally:
+            settings.settings.MAX_HISTORY_ITEMS = original_max
+
+    def test_add_turn_writes_in_background(self, history):
+        """Test that the background writer saves turns without an explicit flush."""
+        from llm_manager.core import conversation
+
+        for i in range(3):
+            history.add_turn(model="openai:gpt-4o", user_prompt=f"Prompt {i}", response="")
+        conversation._write_queue.join()
+
+        lines = history.history_file.read_text().splitlines()
+        assert [json.loads(line)["user_prompt"] for line in lines] == [
+            "Prompt 0", "Prompt 1", "Prompt 2"
+        ]
+
+    def test_add_turn_does_not_wait_for_write(self, history_dir):
+        """Test that turns can be added while a write is in progress."""
+        history = ConversationHistory(history_file=history_dir / "history.json", autosave=False)
+        add = threading.Thread(
+            target=history.add_turn,
+            kwargs={"model": "openai:gpt-4o", "user_prompt": "Prompt", "response": ""},
+        )
 
-            assert len(history.turns) == 1
-            assert history.turns[0].user_prompt == "Existing"
+        with history._write_lock:
+            add.start()
+            add.join(timeout=5)
+            assert not add.is_alive()
+
+        history.flush()
+        assert len(history.history_file.read_bytes().splitlines()) == 1
+
+    def test_rewrite_skips_unchanged_history(self, history):
+        """Test that rewriting identical history leaves the file untouched."""
+        history.add_turn(model="openai:gpt-4o", user_prompt="Test", response="Response")
+        history.clear_history()
+        inode = history.history_file.stat().st_ino
+        history.clear_history()
+
+        assert history.history_file.stat().st_ino == inode
+        assert history.history_file.read_bytes() == b""
+        assert not history.history_file.with_name("history.json.tmp").exists()
+
+        # A file changed outside the history is rewritten even if the turns are not
+        history.history_file.write_text("edited elsewhere\n")
+        history.clear_history()
+        assert history.history_file.read_bytes() == b""
+
+    def test_autosave_disabled_waits_for_flush(self, history_dir):
+        """Test that turns are only written by flush() when autosave is off."""
+        history_file = history_dir / "history.json"
+        history = ConversationHistory(history_file=history_file, autosave=False)
+
+        for i in range(3):
+            history.add_turn(model="openai:gpt-4o", user_prompt=f"Prompt {i}", response="")
+        assert not history_file.exists()
+
+        history.flush()
+        assert len(history_file.read_bytes().splitlines()) == 3
@@ -1,256 +1,238 @@
 """Comprehensive tests for edit mode entry via keyboard and mouse."""
 
+import os
+from unittest.mock import MagicMock
+
 import pytest
-from textual.widgets import TextArea
-from llm_manager.gui.pane import EditablePane
-from pathlib import Path
-import tempfile
+import pytest_asyncio
+from textual.app import App, ComposeResult
+from textual.widgets import Label, TextArea
+from llm_manager.gui.pane import EditablePane, SAVE_DEBOUNCE_SECONDS
+
+
+@pytest.fixture(scope="module")
+def storage_file(tmp_path_factory):
+    """Create one pane storage file shared by the tests in this module."""
+    return tmp_path_factory.mktemp("edit_mode") / "pane.txt"
 
 
 @pytest.fixture
-def temp_file():
-    """Create a temporary file for pane storage."""
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-        f.write("Initial content")
-        temp_path = Path(f.name)
+def temp_file(storage_file):
+    """Reset the shared pane storage file to its initial content."""
+    storage_file.write_text("Initial content")
+    return storage_file
 
-    yield temp_path
 
-    # Cleanup
-    if temp_path.exists():
-        temp_path.unlink()
+class SinglePaneApp(App):
+    """App hosting one EditablePane, shared by the single-pane tests."""
 
+    def __init__(self, storage_path):
+        super().__init__()
+        self.storage_path = storage_path
 
-@pytest.mark.asyncio
-async def test_edit_mode_keyboard_entry(temp_file):
-    """Test entering edit mode with 'i' key and exiting with ESC."""
-    from textual.app import App, ComposeResult
+    def compose(self) -> ComposeResult:
+        yield EditablePane(
+            title="Test Pane",
+            storage_path=self.storage_path,
+            id="test-pane"
+        )
 
-    class TestApp(App):
-        def compose(self) -> ComposeResult:
-            yield EditablePane(
-                title="Test Pane",
-                storage_path=temp_file,
-                id="test-pane"
-            )
 
-    app = TestApp()
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_app(storage_file):
+    """Start one app for every single-pane test in this module."""
+    storage_file.write_text("Initial content")
+    app = SinglePaneApp(storage_file)
     async with app.run_test() as pilot:
-        # Get the pane
-        pane = app.query_one(EditablePane)
+        yield app, pilot
 
-        # Initially should be in command mode
-        assert pane.edit_mode is False, "Should start in command mode"
 
-        # Focus the pane
-        pane.focus()
-        await pilot.pause()
+@pytest_asyncio.fixture(loop_scope="module")
+async def app_pilot(shared_app):
+    """Return the shared app and pilot with the pane reset to command mode."""
+    app, pilot = shared_app
+    pane = app.query_one(EditablePane)
+    pane.exit_edit_mode()
+    pane.query_one(TextArea).load_text("Initial content")
+    app.set_focus(None)
+    await pilot.pause()
+    return app, pilot
 
-        # Press 'i' to enter edit mode
-        await pilot.press("i")
-        await pilot.pause()
 
-        # Should now be in edit mode
-        assert pane.edit_mode is True, "Should be in edit mode after pressing 'i'"
+@pytest.mark.asyncio(loop_scope="module")
+async def test_edit_mode_keyboard_entry(app_pilot):
+    """Test entering edit mode with 'i' key and exiting with ESC."""
+    app, pilot = app_pilot
 
-        # Get the TextArea and verify it has focus
-        text_area = pane.query_one(TextArea)
-        assert text_area.has_focus, "TextArea should have focus in edit mode"
+    # Get the pane
+    pane = app.query_one(EditablePane)
 
-        # Press ESC to exit edit mode
-        await pilot.press("escape")
-        await pilot.pause()
+    # Initially should be in command mode
+    assert pane.edit_mode is False, "Should start in command mode"
 
-        # Should be back in command mode
-        assert pane.edit_mode is False, "Should be in command mode after pressing ESC"
+    # Focus the pane
+    pane.focus()
 
-        # Pane should have focus again
-        assert pane.has_focus, "Pane should have focus after exiting edit mode"
+    # Press 'i' to enter edit mode
+    await pilot.press("i")
+    await pilot.pause()
 
+    # Should now be in edit mode
+    assert pane.edit_mode is True, "Should be in edit mode after pressing 'i'"
 
-@pytest.mark.asyncio
-async def test_edit_mode_mouse_entry(temp_file):
-    """Test entering edit mode with direct TextArea focus (simulates mouse click) and exiting with ESC."""
-    from textual.app import App, ComposeResult
+    # Get the TextArea and verify it has focus
+    text_area = pane.query_one(TextArea)
+    assert text_area.has_focus, "TextArea should have focus in edit mode"
 
-    class TestApp(App):
-        def compose(self) -> ComposeResult:
-            yield EditablePane(
-                title="Test Pane",
-                storage_path=temp_file,
-                id="test-pane"
-            )
+    # Press ESC to exit edit mode
+    await pilot.press("escape")
+    await pilot.pause()
 
-    app = TestApp()
-    async with app.run_test() as pilot:
-        # Get the pane and text area
-        pane = app.query_one(EditablePane)
-        text_area = pane.query_one(TextArea)
+    # Should be back in command mode
+    assert pane.edit_mode is False, "Should be in command mode after pressing ESC"
 
-        # Initially should be in command mode
-        assert pane.edit_mode is False, "Should start in command mode"
+    # Pane should have focus again
+    assert pane.has_focus, "Pane should have focus after exiting edit mode"
 
-        # Simulate mouse click by directly focusing the TextArea
-        text_area.focus()
-        await pilot.pause()
 
-        # The on_focus handler should have set edit_mode to True
-        assert pane.edit_mode is True, "Should be in edit mode after focusing TextArea (simulated mouse click)"
+@pytest.mark.asyncio(loop_scope="module")
+async def test_edit_mode_mouse_entry(app_pilot):
+    """Test entering edit mode with direct TextArea focus (simulates mouse click) and exiting with ESC."""
+    app, pilot = app_pilot
 
-        # TextArea should have focus
-        assert text_area.has_focus, "TextArea should have focus"
+    # Get the pane and text area
+    pane = app.query_one(EditablePane)
+    text_area = pane.query_one(TextArea)
 
-        # Press ESC to exit edit mode
-        await pilot.press("escape")
-        await pilot.pause()
+    # Initially should be in command mode
+    assert pane.edit_mode is False, "Should start in command mode"
 
-        # Should be back in command mode
-        assert pane.edit_mode is False, "Should be in command mode after pressing ESC"
+    # Simulate mouse click by directly focusing the TextArea
+    text_area.focus()
+    await pilot.pause()
 
-        # Pane should have focus again
-        assert pane.has_focus, "Pane should have focus after exiting edit mode"
+    # The on_focus handler should have set edit_mode to True
+    assert pane.edit_mode is True, "Should be in edit mode after focusing TextArea (simulated mouse click)"
 
+    # TextArea should have focus
+    assert text_area.has_focus, "TextArea should have focus"
 
-@pytest.mark.asyncio
-async def test_edit_mode_footer_updates(temp_file):
-    """Test that footer updates correctly when entering/exiting edit mode."""
-    from textual.app import App, ComposeResult
-    from textual.widgets import Label
+    # Press ESC to exit edit mode
+    await pilot.press("escape")
+    await pilot.pause()
 
-    class TestApp(App):
-        def compose(self) -> ComposeResult:
-            yield EditablePane(
-                title="Test Pane",
-                storage_path=temp_file,
-                id="test-pane"
-            )
+    # Should be back in command mode
+    assert pane.edit_mode is False, "Should be in command mode after pressing ESC"
 
-    app = TestApp()
-    async with app.run_test() as pilot:
-        # Get the pane and footer
-        pane = app.query_one(EditablePane)
-        footer = pane.query_one("#test-pane-footer", Label)
+    # Pane should have focus again
+    assert pane.has_focus, "Pane should have focus after exiting edit mode"
 
-        # Initially should show command mode footer
-        initial_text = str(footer.render())
-        assert "i: Edit mode" in initial_text, "Footer should show command mode options"
 
-        # Enter edit mode with 'i'
-        pane.focus()
-        await pilot.pause()
-        await pilot.press("i")
-        await pilot.pause()
+@pytest.mark.asyncio(loop_scope="module")
+async def test_edit_mode_footer_updates(app_pilot):
+    """Test that footer updates correctly when entering/exiting edit mode."""
+    app, pilot = app_pilot
 
-        # Footer should show edit mode
-        edit_text = str(footer.render())
-        assert "-- EDIT MODE --" in edit_text, "Footer should show edit mode indicator"
+    # Get the pane and footer
+    pane = app.query_one(EditablePane)
+    footer = pane.query_one("#test-pane-footer", Label)
 
-        # Exit edit mode with ESC
-        await pilot.press("escape")
-        await pilot.pause()
+    # Initially should show command mode footer
+    initial_text = str(footer.render())
+    assert "i: Edit mode" in initial_text, "Footer should show command mode options"
 
-        # Footer should show command mode again
-        command_text = str(footer.render())
-        assert "i: Edit mode" in command_text, "Footer should show command mode options again"
+    # Enter edit mode with 'i'
+    pane.focus()
+    await pilot.press("i")
+    await pilot.pause()
 
+    # Footer should show edit mode
+    edit_text = str(footer.render())
+    assert "-- EDIT MODE --" in edit_text, "Footer should show edit mode indicator"
 
-@pytest.mark.asyncio
-async def test_edit_mode_typing_and_exit(temp_file):
-    """Test typing in edit mode and exiting."""
-    from textual.app import App, ComposeResult
+    # Exit edit mode with ESC
+    await pilot.press("escape")
+    await pilot.pause()
 
-    class TestApp(App):
-        def compose(self) -> ComposeResult:
-            yield EditablePane(
-                title="Test Pane",
-                storage_path=temp_file,
-                id="test-pane"
-            )
+    # Footer should show command mode again
+    command_text = str(footer.render())
+    assert "i: Edit mode" in command_text, "Footer should show command mode options again"
 
-    app = TestApp()
-    async with app.run_test() as pilot:
-        # Get the pane and text area
-        pane = app.query_one(EditablePane)
-        text_area = pane.query_one(TextArea)
 
-        # Enter edit mode via keyboard
-        pane.focus()
-        await pilot.pause()
-        await pilot.press("i")
-        await pilot.pause()
+@pytest.mark.asyncio(loop_scope="module")
+async def test_edit_mode_typing_and_exit(app_pilot):
+    """Test typing in edit mode and exiting."""
+    app, pilot = app_pilot
 
-        # Type some text
-        await pilot.press("h", "e", "l", "l", "o")
-        await pilot.pause()
+    # Get the pane and text area
+    pane = app.query_one(EditablePane)
+    text_area = pane.query_one(TextArea)
 
-        # Content should be updated
-        assert "hello" in text_area.text, "Text should be typed in edit mode"
+    # Enter edit mode via keyboard
+    pane.focus()
+    await pilot.press("i")
 
-        # Exit edit mode
-        await pilot.press("escape")
-        await pilot.pause()
+    # Type some text
+    await pilot.press(*"hello")
+    await pilot.pause()
 
-        # Should be in command mode
-        assert pane.edit_mode is False, "Should be in command mode"
+    # Content should be updated
+    assert "hello" in text_area.text, "Text should be typed in edit mode"
 
+    # Exit edit mode
+    await pilot.press("escape")
+    await pilot.pause()
 
-@pytest.mark.asyncio
-async def test_edit_mode_mouse_then_keyboard_cycle(temp_file):
-    """Test cycling between command and edit mode using both methods."""
-    from textual.app import App, ComposeResult
+    # Should be in command mode
+    assert pane.edit_mode is False, "Should be in command mode"
 
-    class TestApp(App):
-        def compose(self) -> ComposeResult:
-            yield EditablePane(
-                title="Test Pane",
-                storage_path=temp_file,
-                id="test-pane"
-            )
 
-    app = TestApp()
-    async with app.run_test() as pilot:
-        # Get the pane and text area
-        pane = app.query_one(EditablePane)
-        text_area = pane.query_one(TextArea)
+@pytest.mark.asyncio(loop_scope="module")
+async def test_edit_mode_mouse_then_keyboard_cycle(app_pilot):
+    """Test cycling between command and edit mode using both methods."""
+    app, pilot = app_pilot
 
-        # Start in command mode
-        assert pane.edit_mode is False
+    # Get the pane and text area
+    pane = app.query_one(EditablePane)
+    text_area = pane.query_one(TextArea)
 
-        # Enter via mouse (direct focus)
-        text_area.focus()
-        await pilot.pause()
-        assert pane.edit_mode is True, "Should enter edit mode via mouse"
+    # Start in command mode
+    assert pane.edit_mode is False
 
-        # Exit with ESC
-        await pilot.press("escape")
-        await pilot.pause()
-        assert pane.edit_mode is False, "Should exit edit mode"
+    # Enter via mouse (direct focus)
+    text_area.focus()
+    await pilot.pause()
+    assert pane.edit_mode is True, "Should enter edit mode via mouse"
 
-        # Enter via keyboard
-        await pilot.press("i")
-        await pilot.pause()
-        assert pane.edit_mode is True, "Should enter edit mode via keyboard"
+    # Exit with ESC
+    await pilot.press("escape")
+    await pilot.pause()
+    assert pane.edit_mode is False, "Should exit edit mode"
 
-        # Exit with ESC
-        await pilot.press("escape")
-        await pilot.pause()
-        assert pane.edit_mode is False, "Should exit edit mode"
+    # Enter via keyboard
+    await pilot.press("i")
+    await pilot.pause()
+    assert pane.edit_mode is True, "Should enter edit mode via keyboard"
 
-        # Enter via mouse again
-        text_area.focus()
-        await pilot.pause()
-        assert pane.edit_mode is True, "Should enter edit mode via mouse again"
+    # Exit with ESC
+    await pilot.press("escape")
+    await pilot.pause()
+    assert pane.edit_mode is False, "Should exit edit mode"
 
-        # Exit with ESC
-        await pilot.press("escape")
-        await pilot.pause()
-        assert pane.edit_mode is False, "Should exit edit mode"
+    # Enter via mouse again
+    text_area.focus()
+    await pilot.pause()
+    assert pane.edit_mode is True, "Should enter edit mode via mouse again"
+
+    # Exit with ESC
+    await pilot.press("escape")
+    await pilot.pause()
+    assert pane.edit_mode is False, "Should exit edit mode"
 
 
 @pytest.mark.asyncio
 async def test_edit_mode_no_auto_exit_on_blur(temp_file):
     """Test that edit mode does NOT automatically exit when pane loses focus."""
-    from textual.app import App, ComposeResult
 
     class TestApp(App):
         def compose(self) -> ComposeResult:
@@ -274,7 +256,6 @@ async def test_edit_mode_no_auto_exit_on_blur(temp_file):
 
         # Enter edit mode in pane1
         pane1.focus()
-        await pilot.pause()
         await pilot.press("i")
         await pilot.pause()
 
@@ -289,5 +270,95 @@ async def test_edit_mode_no_auto_exit_on_blur(temp_file):
         assert pane1.edit_mode is True, "Pane1 should remain in edit mode after losing focus"
 
 
+@pytest.mark.asyncio
+async def test_save_waits_for_load_and_write(tmp_path):
+    """Test that saves are refused before loading and announced after writing."""
+    storage_path = tmp_path / "pane.txt"
+    storage_path.write_text("Saved earlier")
+
+    class LazyApp(App):
+        def compose(self) -> ComposeResult:
+            yield EditablePane(
+                title="Lazy Pane",
+                storage_path=storage_path,
+                load_on_mount=False,
+                id="lazy-pane"
+            )
+
+    app = LazyApp()
+    async with app.run_test() as pilot:
+        pane = app.query_one(EditablePane)
+        app.notify = MagicMock()
+
+        # The empty TextArea must not replace the file before loading finishes
+        assert pane.save_content(announce=True) is False
+        await pilot.pause(SAVE_DEBOUNCE_SECONDS * 2)
+        assert storage_path.read_text() == "Saved earlier"
+
+        await pane.load_content_in_thread()
+        pane.content = "New content"
+        assert pane.save_content(announce=True) is True
+        app.notify.assert_called_once()  # Only the "not loaded" warning so far
+
+        await pilot.pause(SAVE_DEBOUNCE_SECONDS * 2)
+        assert storage_path.read_text() == "New content"
+        app.notify.assert_called_with("Lazy Pane saved", severity="information")
+
+
+@pytest.mark.asyncio
+async def test_typing_ignored_until_loaded(tmp_path):
+    """Test that the editor stays read-only until the threaded load finishes."""
+    storage_path = tmp_path / "pane.txt"
+    storage_path.write_text("Saved earlier")
+
+    class LazyApp(App):
+        def compose(self) -> ComposeResult:
+            yield EditablePane(
+                title="Lazy Pane",
+                storage_path=storage_path,
+                load_on_mount=False,
+                id="lazy-pane"
+            )
+
+    app = LazyApp()
+    async with app.run_test() as pilot:
+        pane = app.query_one(EditablePane)
+        pane.focus()
+        pane.enter_edit_mode()
+        await pilot.press("x", "y")
+        assert pane.content == ""
+
+        await pane.load_content_in_thread()
+        assert pane.content == "Saved earlier"
+        await pilot.press("x")
+        assert "x" in pane.content
+
+
+def test_write_storage_repairs_external_change(tmp_path):
+    """Test that saving unchanged content rewrites a file changed elsewhere."""
+    storage_path = tmp_path / "pane.txt"
+    pane = EditablePane(title="Pane", storage_path=storage_path, id="pane")
+
+    pane._write_storage("Saved content")
+    storage_path.write_text("")  # Truncated outside the app
+    pane._write_storage("Saved content")
+
+    assert storage_path.read_text() == "Saved content"
+
+
+def test_read_storage_notices_same_mtime_rewrite(tmp_path):
+    """Test that the content cache also checks the file size."""
+    storage_path = tmp_path / "pane.txt"
+    storage_path.write_text("Short")
+    pane = EditablePane(title="Pane", storage_path=storage_path, id="pane")
+    assert pane._read_storage() == "Short"
+
+    # Rewritten within the same mtime tick
+    mtime_ns = storage_path.stat().st_mtime_ns
+    storage_path.write_text("Longer content")
+    os.utime(storage_path, ns=(mtime_ns, mtime_ns))
+    assert pane._read_storage() == "Longer content"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
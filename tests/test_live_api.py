@@ -7,168 +7,274 @@ This test requires valid API keys in environment variables:
 Note: This test makes real API calls and may incur costs.
 """
 
+import asyncio
 import os
+import re
+import sys
+import time
 import pytest
-from llm_manager.core.llm_client import LLMClient
-from llm_manager.core.conversation import ConversationHistory
 from pathlib import Path
 import tempfile
 
-
-@pytest.mark.skipif(
-    not os.environ.get("OPENAI_API_KEY"),
-    reason="OPENAI_API_KEY not set"
+# Skip the whole module up front when no provider key is configured
+pytestmark = pytest.mark.skipif(
+    not (os.environ.get("OPENAI_API_KEY") or os.environ.get("ANTHROPIC_API_KEY")),
+    reason="No API keys set"
 )
-def test_openai_non_streaming():
-    """Test OpenAI API with non-streaming response."""
-    print("\n🔵 Testing OpenAI (non-streaming)...")
 
-    client = LLMClient()
-    success = client.set_model("openai:gpt-4o-mini")
-    assert success, "Failed to initialize OpenAI client"
+OPENAI_MODEL = "openai:gpt-4o-mini"
+ANTHROPIC_MODEL = "anthropic:claude-3-haiku-20240307"
 
-    response = client.send_message(
-        user_prompt="Say 'Hello from OpenAI' and nothing else.",
-        system_prompt="You are a helpful assistant.",
-        context=""
-    )
+# The count answer: 1, 2 and 3 in order, however they are separated
+_COUNT = re.compile(r"1\D+2\D+3")
 
-    print(f"✅ OpenAI Response: {response}")
-    assert len(response) > 0, "Response is empty"
-    assert "openai" in response.lower() or "hello" in response.lower()
+# Console output is only produced when LLM_MANAGER_TEST_VERBOSE is set
+_V = bool(os.environ.get("LLM_MANAGER_TEST_VERBOSE"))
 
 
-@pytest.mark.skipif(
-    not os.environ.get("OPENAI_API_KEY"),
-    reason="OPENAI_API_KEY not set"
-)
-def test_openai_streaming():
-    """Test OpenAI API with streaming response."""
-    print("\n🔵 Testing OpenAI (streaming)...")
+def _vprint(*args, **kwargs):
+    """Print only in verbose mode."""
+    if _V:
+        print(*args, **kwargs)
+
+
+def _make_client(model):
+    """Create an LLMClient set up for the given model."""
+    from llm_manager.core.llm_client import LLMClient
 
     client = LLMClient()
-    success = client.set_model("openai:gpt-4o-mini")
-    assert success, "Failed to initialize OpenAI client"
+    assert client.set_model(model), f"Failed to initialize client for {model}"
+    return client
+
+
+@pytest.fixture(scope="module")
+def openai_client():
+    """One OpenAI client, and its HTTP connection pool, shared by the module."""
+    return _make_client(OPENAI_MODEL)
+
 
+@pytest.fixture(scope="module")
+def anthropic_client():
+    """One Anthropic client, and its HTTP connection pool, shared by the module."""
+    return _make_client(ANTHROPIC_MODEL)
+
+
+def _drain_stream(stream, until=None, buf_chars=8192, flush_seconds=0.025):
+    """Collect a response stream's chunks, echoing them in verbose mode.
+
+    Output is written once buf_chars have piled up or flush_seconds have
+    passed, instead of one write and flush per chunk. Once until is
+    satisfied the stream is closed, which ends the request early.
+
+    Args:
+        stream: Generator of response chunks
+        until: Optional predicate on the chunks received so far that stops
+            reading once it returns True
+        buf_chars: Buffered characters that trigger a write
+        flush_seconds: Maximum time output stays buffered
+
+    Returns:
+        List of the chunks received
+    """
     chunks = []
-    for chunk in client.stream_message(
-        user_prompt="Count from 1 to 3, one number per word.",
-        system_prompt="You are a helpful assistant.",
-        context=""
-    ):
-        chunks.append(chunk)
-        print(chunk, end="", flush=True)
+    pending = []
+    pending_chars = 0
+    last_flush = time.monotonic()
+    try:
+        for chunk in stream:
+            chunks.append(chunk)
+            if _V:
+                pending.append(chunk)
+                pending_chars += len(chunk)
+                now = time.monotonic()
+                if pending_chars >= buf_chars or now - last_flush >= flush_seconds:
+                    sys.stdout.writelines(pending)
+                    sys.stdout.flush()
+                    pending.clear()
+                    pending_chars = 0
+                    last_flush = now
+            if until is not None and until(chunks):
+                break
+    finally:
+        stream.close()
+    if _V:
+        sys.stdout.writelines(pending)
+        sys.stdout.flush()
+    return chunks
+
+
+def _count_finished(chunks):
+    """Check whether a streamed answer has counted up to 3 after its first line.
+
+    The count is the last answer checked, so the rest of the stream is
+    not needed.
+    """
+    # Only join the chunks once the count could have finished
+    if len(chunks) < 2 or not any("3" in chunk for chunk in chunks):
+        return False
+    _, _, rest = "".join(chunks).partition("\n")
+    return _COUNT.search(rest) is not None
+
+
+# Per provider: model, console marker, display name, name it greets with
+PROVIDERS = {
+    "openai": (OPENAI_MODEL, "🔵", "OpenAI", "OpenAI"),
+    "anthropic": (ANTHROPIC_MODEL, "🟣", "Anthropic", "Claude"),
+}
+
+
+@pytest.fixture
+def client_for(request):
+    """Look up the shared client fixture for a provider by name."""
+    return lambda provider: request.getfixturevalue(f"{provider}_client")
+
+
+def _smoke_prompt(greeting):
+    """Build the prompt asking for both smoke check answers at once."""
+    return (
+        "Answer each on its own line. "
+        f"1) Say 'Hello from {greeting}'. 2) Count from 1 to 3, one number per word."
+    )
 
-    print()  # New line after streaming
-    full_response = "".join(chunks)
-    print(f"✅ OpenAI Streaming Response: {full_response}")
-    assert len(chunks) > 1, "Should have received multiple chunks"
-    assert len(full_response) > 0, "Response is empty"
 
+def _check_answer(provider, response):
+    """Assert that a response holds the greeting line followed by the count.
 
-@pytest.mark.skipif(
-    not os.environ.get("ANTHROPIC_API_KEY"),
-    reason="ANTHROPIC_API_KEY not set"
-)
-def test_anthropic_non_streaming():
-    """Test Anthropic API with non-streaming response."""
-    print("\n🟣 Testing Anthropic (non-streaming)...")
+    Args:
+        provider: Key into PROVIDERS
+        response: Full text of the response
+    """
+    _, _, name, greeting = PROVIDERS[provider]
+    lines = [line.lower() for line in response.splitlines() if line.strip()]
+    assert len(lines) >= 2, f"{name}: should have answered each request on its own line"
+    assert greeting.lower() in lines[0] or "hello" in lines[0], f"{name}: greeting is missing"
+    assert _COUNT.search(" ".join(lines[1:])), f"{name}: count to 3 is missing"
 
-    client = LLMClient()
-    success = client.set_model("anthropic:claude-3-haiku-20240307")
-    assert success, "Failed to initialize Anthropic client"
 
+def _check_send(provider, client):
+    """Check a provider's non-streaming API with the combined prompt.
+
+    Args:
+        provider: Key into PROVIDERS
+        client: LLMClient set up for the provider's model
+    """
+    _, marker, name, greeting = PROVIDERS[provider]
     response = client.send_message(
-        user_prompt="Say 'Hello from Claude' and nothing else.",
+        user_prompt=_smoke_prompt(greeting),
         system_prompt="You are a helpful assistant.",
         context=""
     )
+    _vprint(f"✅ {marker} {name} Response: {response}")
+    _check_answer(provider, response)
 
-    print(f"✅ Anthropic Response: {response}")
-    assert len(response) > 0, "Response is empty"
-    assert "claude" in response.lower() or "hello" in response.lower()
 
+def _check_stream(provider, client):
+    """Check a provider's streaming API with the combined prompt.
 
-@pytest.mark.skipif(
-    not os.environ.get("ANTHROPIC_API_KEY"),
-    reason="ANTHROPIC_API_KEY not set"
-)
-def test_anthropic_streaming():
-    """Test Anthropic API with streaming response."""
-    print("\n🟣 Testing Anthropic (streaming)...")
-
-    client = LLMClient()
-    success = client.set_model("anthropic:claude-3-haiku-20240307")
-    assert success, "Failed to initialize Anthropic client"
+    Streaming stops once the count has finished.
 
-    chunks = []
-    for chunk in client.stream_message(
-        user_prompt="Count from 1 to 3, one number per word.",
+    Args:
+        provider: Key into PROVIDERS
+        client: LLMClient set up for the provider's model
+    """
+    _, marker, name, greeting = PROVIDERS[provider]
+    chunks = _drain_stream(client.stream_message(
+        user_prompt=_smoke_prompt(greeting),
         system_prompt="You are a helpful assistant.",
         context=""
-    ):
-        chunks.append(chunk)
-        print(chunk, end="", flush=True)
+    ), until=_count_finished)
 
-    print()  # New line after streaming
+    _vprint()  # New line after streaming
     full_response = "".join(chunks)
-    print(f"✅ Anthropic Streaming Response: {full_response}")
-    assert len(chunks) > 1, "Should have received multiple chunks"
-    assert len(full_response) > 0, "Response is empty"
+    _vprint(f"✅ {marker} {name} Streaming Response: {full_response}")
+    assert len(chunks) > 1, f"{name}: should have received multiple chunks"
+    _check_answer(provider, full_response)
+
+
+def _provider_param(provider):
+    """Build one test_llm_roundtrip case, skipped when its API key is missing."""
+    key = f"{provider.upper()}_API_KEY"
+    return pytest.param(
+        provider,
+        id=provider,
+        marks=pytest.mark.skipif(not os.environ.get(key), reason=f"{key} not set"),
+    )
 
 
-@pytest.mark.skipif(
-    not (os.environ.get("OPENAI_API_KEY") or os.environ.get("ANTHROPIC_API_KEY")),
-    reason="No API keys set"
-)
-def test_conversation_history_integration():
+@pytest.mark.asyncio
+@pytest.mark.parametrize("provider", [_provider_param(p) for p in PROVIDERS])
+async def test_llm_roundtrip(provider, client_for):
+    """Test a provider's non-streaming and streaming APIs concurrently.
+
+    The greeting and counting checks share a single prompt, so each mode
+    costs one round trip. Both requests run side by side in worker threads,
+    so the test takes as long as the slower one. The providers are
+    independent, so `pytest -n 2 tests/test_live_api.py` (with pytest-xdist)
+    runs them side by side as well.
+    """
+    _, marker, name, _ = PROVIDERS[provider]
+    _vprint(f"\n{marker} Testing {name}...")
+
+    client = client_for(provider)
+    await asyncio.gather(
+        asyncio.to_thread(_check_send, provider, client),
+        asyncio.to_thread(_check_stream, provider, client),
+    )
+
+
+def test_conversation_history_integration(shared_file):
     """Test conversation history with live API."""
-    print("\n📝 Testing Conversation History...")
+    from llm_manager.core.conversation import ConversationHistory
+    from llm_manager.core.llm_client import LLMClient
+
+    _vprint("\n📝 Testing Conversation History...")
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        history_file = Path(tmpdir) / "test_history.json"
-        history = ConversationHistory(history_file=history_file)
+    history_file = shared_file("test_history.json")
+    history = ConversationHistory(history_file=history_file, autosave=False)
 
-        client = LLMClient()
+    client = LLMClient()
 
-        # Use whichever API key is available
-        if os.environ.get("OPENAI_API_KEY"):
-            model = "openai:gpt-4o-mini"
-        else:
-            model = "anthropic:claude-3-haiku-20240307"
+    # Use whichever API key is available
+    if os.environ.get("OPENAI_API_KEY"):
+        model = OPENAI_MODEL
+    else:
+        model = ANTHROPIC_MODEL
 
-        client.set_model(model)
+    client.set_model(model)
 
-        user_prompt = "What is 2+2? Answer with just the number."
-        response = client.send_message(user_prompt, "", "")
+    user_prompt = "What is 2+2? Answer with just the number."
+    response = client.send_message(user_prompt, "", "")
 
-        # Save to history
-        history.add_turn(
-            model=model,
-            user_prompt=user_prompt,
-            response=response,
-            system_prompt="",
-            context=""
-        )
+    # Save to history
+    history.add_turn(
+        model=model,
+        user_prompt=user_prompt,
+        response=response,
+        system_prompt="",
+        context=""
+    )
+    history.flush()
 
-        print(f"✅ Conversation saved to history")
-        print(f"   User: {user_prompt}")
-        print(f"   Assistant: {response}")
+    _vprint(f"✅ Conversation saved to history")
+    _vprint(f"   User: {user_prompt}")
+    _vprint(f"   Assistant: {response}")
 
-        # Verify history was saved
-        assert len(history.turns) == 1
-        assert history.turns[0].user_prompt == user_prompt
-        assert history.turns[0].response == response
+    # Verify history was saved
+    assert len(history.turns) == 1
+    assert history.turns[0].user_prompt == user_prompt
+    assert history.turns[0].response == response
+    assert history_file.exists()
 
-        # Test export
-        export_file = Path(tmpdir) / "export.json"
-        success = history.export_to_file(export_file, format="json")
-        assert success
-        assert export_file.exists()
-        print(f"✅ Conversation exported successfully")
+    # Test export
+    export_file = shared_file("export.json")
+    success = history.export_to_file(export_file, format="json")
+    assert success
+    assert export_file.exists()
+    _vprint(f"✅ Conversation exported successfully")
 
 
 if __name__ == "__main__":
+    _V = True  # Running as a script is for watching the responses
     print("=" * 60)
     print("LIVE API TESTS")
     print("=" * 60)
@@ -176,28 +282,14 @@ if __name__ == "__main__":
     print()
 
     # Run tests manually
-    try:
-        test_openai_non_streaming()
-    except Exception as e:
-        print(f"❌ OpenAI non-streaming test failed: {e}")
-
-    try:
-        test_openai_streaming()
-    except Exception as e:
-        print(f"❌ OpenAI streaming test failed: {e}")
-
-    try:
-        test_anthropic_non_streaming()
-    except Exception as e:
-        print(f"❌ Anthropic non-streaming test failed: {e}")
-
-    try:
-        test_anthropic_streaming()
-    except Exception as e:
-        print(f"❌ Anthropic streaming test failed: {e}")
+    for provider, (_, _, name, _) in PROVIDERS.items():
+        try:
+            asyncio.run(test_llm_roundtrip(provider, lambda p: _make_client(PROVIDERS[p][0])))
+        except Exception as e:
+            print(f"❌ {name} test failed: {e}")
 
     try:
-        test_conversation_history_integration()
+        test_conversation_history_integration(lambda name: Path(tempfile.mkdtemp()) / name)
     except Exception as e:
         print(f"❌ Conversation history test failed: {e}")
 
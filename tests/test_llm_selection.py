@@ -1,11 +1,19 @@
 """Tests for LLM selection and client."""
 
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
-from pathlib import Path
-from unittest.mock import patch
+from textual.widgets.option_list import Option
 
+from llm_manager.core.llm_client import LLMClient
 from llm_manager.core.models import get_model_config, AVAILABLE_MODELS
 from llm_manager.core.settings import Settings
+from llm_manager.gui.llm_pane import LLMSelectionPane
+from llm_manager.gui.main_window import LLMManagerApp
+
+# Every model's configuration, loaded once for the whole module
+_CONFIGS = {name: get_model_config(name) for name in AVAILABLE_MODELS}
 
 
 class TestModelConfiguration:
@@ -13,16 +21,18 @@ class TestModelConfiguration:
 
     def test_all_models_loadable(self):
         """Test that all models can be loaded."""
-        for model_name in AVAILABLE_MODELS:
-            config = get_model_config(model_name)
-            assert config is not None
-            assert config.name == model_name
-            assert config.context_window > 0
-            assert config.max_output_tokens > 0
+        bad = [
+            name for name, config in _CONFIGS.items()
+            if config is None
+            or config.name != name
+            or config.context_window <= 0
+            or config.max_output_tokens <= 0
+        ]
+        assert not bad, f"Invalid model configs: {bad}"
 
     def test_openai_models(self):
         """Test OpenAI model configurations."""
-        gpt4o = get_model_config("openai:gpt-4o")
+        gpt4o = _CONFIGS["openai:gpt-4o"]
         assert gpt4o is not None
         assert gpt4o.provider == "openai"
         assert gpt4o.display_name == "GPT-4o"
@@ -30,7 +40,7 @@ class TestModelConfiguration:
 
     def test_anthropic_models(self):
         """Test Anthropic model configurations."""
-        claude = get_model_config("anthropic:claude-3-5-sonnet-latest")
+        claude = _CONFIGS["anthropic:claude-3-5-sonnet-latest"]
         assert claude is not None
         assert claude.provider == "anthropic"
         assert claude.display_name == "Claude 3.5 Sonnet"
@@ -47,16 +57,116 @@ class TestSettings:
 
     def test_selected_model_file_creation(self, tmp_path):
         """Test that selected model file is created."""
-        with patch.object(Path, 'home', return_value=tmp_path):
-            settings = Settings()
-            settings.DATA_DIR = tmp_path / "data"
-            settings.SELECTED_MODEL_FILE = settings.DATA_DIR / "selected_model.txt"
+        settings = Settings(home_dir=tmp_path)
+
+        settings.ensure_files()
+
+        assert settings.SELECTED_MODEL_FILE.exists()
+        content = settings.SELECTED_MODEL_FILE.read_text()
+        assert content == settings.DEFAULT_MODEL
+
+
+class FakeClient:
+    """LLMClient stand-in that answers with the model name."""
+
+    set_model_threads = []
+
+    def set_model(self, model_name):
+        self.set_model_threads.append(threading.get_ident())
+        self.model = model_name
+        return model_name != "openai:missing"
+
+    async def asend_message(self, user_prompt, system_prompt="", context=""):
+        if self.model == "anthropic:claude-3-haiku-20240307":
+            raise RuntimeError("rate limited")
+        return f"{self.model} says hi"
+
+
+class TestMultiModelSend:
+    """Test sending prompts to several models for comparison."""
+
+    def test_toggle_compare(self):
+        """Test that toggling compare changes the models sent to."""
+        pane = LLMSelectionPane()
+        pane.selected_model = "openai:gpt-4o"
+        assert pane.get_selected_models() == ["openai:gpt-4o"]
+
+        option_list = MagicMock()
+        option_list.get_option_at_index.return_value = Option(
+            "Claude", id="anthropic:claude-3-haiku-20240307"
+        )
+        with patch.object(pane, "query_one", return_value=option_list), \
+                patch.object(pane, "_update_feedback_box"):
+            pane.action_toggle_compare()
+            assert pane.get_selected_models() == ["anthropic:claude-3-haiku-20240307"]
+
+            pane.action_toggle_compare()
+            assert pane.get_selected_models() == ["openai:gpt-4o"]
+
+    def test_set_model_switches_after_client_is_built(self):
+        """Test that current_model only changes once the provider client exists."""
+        client = LLMClient()
+        seen = []
+        fake_openai = MagicMock()
+        fake_openai.OpenAI.side_effect = lambda **kwargs: seen.append(client.current_model)
+
+        with patch.dict("sys.modules", {"openai": fake_openai}), \
+                patch("llm_manager.core.llm_client.settings") as settings:
+            settings.OPENAI_API_KEY = ""
+            assert client.set_model("openai:gpt-4o") is False
+            assert client.current_model is None
+
+            settings.OPENAI_API_KEY = "sk-test"
+            assert client.set_model("openai:gpt-4o") is True
+
+        assert seen == [None]
+        assert client.current_model == "openai:gpt-4o"
+
+    @pytest.mark.asyncio
+    async def test_asend_message(self):
+        """Test that asend_message delegates to send_message."""
+        client = LLMClient()
+        with patch.object(client, "send_message", return_value="Hi") as send_message:
+            assert await client.asend_message("Hello", "System") == "Hi"
+        send_message.assert_called_once_with("Hello", "System", "", None)
+
+    @pytest.mark.asyncio
+    async def test_send_to_all(self):
+        """Test that every model's reply or error is shown and replies are saved."""
+        app = MagicMock()
+        models = ["openai:gpt-4o", "openai:missing", "anthropic:claude-3-haiku-20240307"]
+        FakeClient.set_model_threads.clear()
+
+        with patch("llm_manager.gui.main_window.LLMClient", FakeClient):
+            await LLMManagerApp._send_to_all(app, models, "Hello", "", "")
+
+        # set_model imports SDKs, so it must not run on the event loop thread
+        assert threading.get_ident() not in FakeClient.set_model_threads
+
+        shown = "".join(c.args[0] for c in app.response_pane.append_response_chunk.call_args_list)
+        assert "=== openai:gpt-4o ===\nopenai:gpt-4o says hi" in shown
+        assert "=== openai:missing ===\nError: Failed to initialize model" in shown
+        assert "Error: rate limited" in shown
+
+        app.conversation_history.add_turn.assert_called_once()
+        assert app.conversation_history.add_turn.call_args.kwargs["model"] == "openai:gpt-4o"
+        app.notify.assert_called_once_with("2 of 3 models failed", severity="warning")
+
+    @pytest.mark.asyncio
+    async def test_send_to_llm_sets_model_off_loop(self):
+        """Test that a send switches models in a worker thread before sending."""
+        app = MagicMock()
+        app.llm_client = FakeClient()
+        app.llm_client.current_model = None
+        app.response_pane.streaming_enabled = False
+        app._send_non_streaming = AsyncMock()
+        FakeClient.set_model_threads.clear()
 
-            settings.ensure_files()
+        await LLMManagerApp._send_to_llm(app, "openai:gpt-4o", "Hello", "", "")
 
-            assert settings.SELECTED_MODEL_FILE.exists()
-            content = settings.SELECTED_MODEL_FILE.read_text()
-            assert content == settings.DEFAULT_MODEL
+        assert FakeClient.set_model_threads
+        assert threading.get_ident() not in FakeClient.set_model_threads
+        app._send_non_streaming.assert_awaited_once_with("Hello", "", "")
 
 
 if __name__ == "__main__":
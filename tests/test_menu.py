@@ -1,22 +1,15 @@
 """Tests for menu system functionality."""
 
-import pytest
-from llm_manager.gui.main_window import LLMManagerApp
 from llm_manager.gui.menu import PaneMenuScreen
 
 
 class TestMenuSystem:
     """Test suite for menu system features."""
 
-    @pytest.fixture
-    def app(self):
-        """Create an app instance for testing."""
-        return LLMManagerApp()
-
-    def test_app_has_menu_action(self, app):
+    def test_app_has_menu_action(self, app_probe):
         """Test that app has menu action method."""
-        assert hasattr(app, 'action_show_pane_menu')
-        assert callable(app.action_show_pane_menu)
+        assert hasattr(app_probe, 'action_show_pane_menu')
+        assert callable(app_probe.action_show_pane_menu)
 
     def test_pane_state_accessible_to_menu(self, app):
         """Test that PaneState is accessible to menu."""
@@ -33,25 +26,18 @@ class TestMenuSystem:
         panes = app._get_pane_list()
         assert len(panes) == 6
 
-        pane_names = [name for _, name in panes]
-        assert "Root" in pane_names
-        assert "User Prompt" in pane_names
-        assert "System Prompt" in pane_names
-        assert "Context" in pane_names
-        assert "LLM Selection" in pane_names
-        assert "Response" in pane_names
+        names = {name for _, name in panes}
+        assert {
+            "Root", "User Prompt", "System Prompt", "Context", "LLM Selection", "Response"
+        } <= names
 
     def test_child_panes_accessible(self, app):
         """Test that child panes (excluding root) can be accessed."""
         child_panes = app._get_child_panes()
         assert len(child_panes) == 5
 
-        pane_names = [name for _, name in child_panes]
-        assert "User Prompt" in pane_names
-        assert "System Prompt" in pane_names
-        assert "Context" in pane_names
-        assert "LLM Selection" in pane_names
-        assert "Response" in pane_names
+        names = {name for _, name in child_panes}
+        assert {"User Prompt", "System Prompt", "Context", "LLM Selection", "Response"} <= names
 
     def test_pane_has_display_style(self, app):
         """Test that panes have display style attribute."""
@@ -71,11 +57,11 @@ class TestMenuSystem:
         # Initially empty, set during on_mount
         assert isinstance(app.root_pane.child_panes, list)
 
-    def test_root_level_operations_exist(self, app):
+    def test_root_level_operations_exist(self, app_probe):
         """Test that root-level operation methods exist."""
-        assert hasattr(app, 'action_hide_all_children')
-        assert callable(app.action_hide_all_children)
-        assert hasattr(app, 'action_show_all_children')
-        assert callable(app.action_show_all_children)
-        assert hasattr(app, 'action_reset_layout')
-        assert callable(app.action_reset_layout)
+        assert hasattr(app_probe, 'action_hide_all_children')
+        assert callable(app_probe.action_hide_all_children)
+        assert hasattr(app_probe, 'action_show_all_children')
+        assert callable(app_probe.action_show_all_children)
+        assert hasattr(app_probe, 'action_reset_layout')
+        assert callable(app_probe.action_reset_layout)
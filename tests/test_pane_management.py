@@ -1,5 +1,7 @@
 """Tests for pane management (maximize, minimize, resize) functionality."""
 
+from unittest.mock import PropertyMock, patch
+
 import pytest
 from textual.widgets import TextArea
 
@@ -9,11 +11,6 @@ from llm_manager.gui.main_window import LLMManagerApp, PaneState
 class TestPaneManagement:
     """Test suite for pane management features."""
 
-    @pytest.fixture
-    def app(self):
-        """Create an app instance for testing."""
-        return LLMManagerApp()
-
     def test_pane_states_initialized(self, app):
         """Test that pane states dictionary is initialized."""
         # States are initialized in on_mount, so we just verify the dict exists
@@ -42,48 +39,54 @@ class TestPaneManagement:
         app._restore_all_panes()
         assert app.pane_states[app.user_prompt_pane] == PaneState.NORMAL
 
+    def test_pane_meta(self, app):
+        """Test the display name and row index recorded for each pane."""
+        # Root pane doesn't have a specific row (contains all rows)
+        assert app._pane_meta == {
+            app.root_pane: ("Root", None),
+            app.user_prompt_pane: ("User Prompt", 0),
+            app.system_prompt_pane: ("System Prompt", 0),
+            app.context_pane: ("Context", 1),
+            app.llm_selection_pane: ("LLM Selection", 1),
+            app.response_pane: ("Response", 2),
+        }
+
     def test_get_pane_name(self, app):
         """Test getting pane display names."""
-        assert app._get_pane_name(app.root_pane) == "Root"
         assert app._get_pane_name(app.user_prompt_pane) == "User Prompt"
-        assert app._get_pane_name(app.system_prompt_pane) == "System Prompt"
-        assert app._get_pane_name(app.context_pane) == "Context"
-        assert app._get_pane_name(app.llm_selection_pane) == "LLM Selection"
         assert app._get_pane_name(app.response_pane) == "Response"
+        assert app._get_pane_name(object()) == "Unknown"
 
     def test_get_pane_row(self, app):
         """Test getting pane row indices."""
-        # Root pane doesn't have a specific row (contains all rows)
         assert app._get_pane_row(app.root_pane) is None
-
-        # Row 0: User Prompt and System Prompt
-        assert app._get_pane_row(app.user_prompt_pane) == 0
-        assert app._get_pane_row(app.system_prompt_pane) == 0
-
-        # Row 1: Context and LLM Selection
         assert app._get_pane_row(app.context_pane) == 1
-        assert app._get_pane_row(app.llm_selection_pane) == 1
+        assert app._get_pane_row(object()) is None
 
-        # Row 2: Response
-        assert app._get_pane_row(app.response_pane) == 2
+    def test_get_focused_editable(self, app):
+        """Test that only focus inside an editable pane selects it."""
+        app._current_pane_index = app._pane_index[app.context_pane]
+        with patch.object(LLMManagerApp, "focused", new_callable=PropertyMock) as focused:
+            focused.return_value = app.context_pane
+            assert app._get_focused_editable() is app.context_pane
+
+            # Focus outside the editable panes, e.g. in a menu or on the root
+            for widget in (None, app.root_pane, app.response_pane):
+                focused.return_value = widget
+                assert app._get_focused_editable() is None
+        app._current_pane_index = 0
 
     def test_pane_list(self, app):
         """Test that _get_pane_list returns all panes in order."""
         panes = app._get_pane_list()
         assert len(panes) == 6
 
-        pane_objects, pane_names = zip(*panes)
-
-        assert app.root_pane in pane_objects
-        assert app.user_prompt_pane in pane_objects
-        assert app.system_prompt_pane in pane_objects
-        assert app.context_pane in pane_objects
-        assert app.llm_selection_pane in pane_objects
-        assert app.response_pane in pane_objects
-
-        assert "Root" in pane_names
-        assert "User Prompt" in pane_names
-        assert "System Prompt" in pane_names
-        assert "Context" in pane_names
-        assert "LLM Selection" in pane_names
-        assert "Response" in pane_names
+        pane_objects, pane_names = map(set, zip(*panes))
+
+        assert {
+            app.root_pane, app.user_prompt_pane, app.system_prompt_pane,
+            app.context_pane, app.llm_selection_pane, app.response_pane,
+        } <= pane_objects
+        assert {
+            "Root", "User Prompt", "System Prompt", "Context", "LLM Selection", "Response"
+        } <= pane_names
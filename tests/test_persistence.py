@@ -10,9 +10,9 @@ from llm_manager.core.persistence import PaneStorage, PaneManager
 class TestPaneStorage:
     """Test PaneStorage class."""
 
-    def test_create_and_read(self, tmp_path):
+    def test_create_and_read(self, shared_file):
         """Test creating and reading from storage."""
-        test_file = tmp_path / "test.txt"
+        test_file = shared_file("test.txt")
         storage = PaneStorage(test_file)
 
         # File should be created
@@ -22,9 +22,9 @@ class TestPaneStorage:
         content = storage.read()
         assert content == ""
 
-    def test_write_and_read(self, tmp_path):
+    def test_write_and_read(self, shared_file):
         """Test writing and reading content."""
-        test_file = tmp_path / "test.txt"
+        test_file = shared_file("test.txt")
         storage = PaneStorage(test_file)
 
         # Write content
@@ -36,9 +36,9 @@ class TestPaneStorage:
         content = storage.read()
         assert content == test_content
 
-    def test_write_multiline(self, tmp_path):
+    def test_write_multiline(self, shared_file):
         """Test writing multiline content."""
-        test_file = tmp_path / "test.txt"
+        test_file = shared_file("test.txt")
         storage = PaneStorage(test_file)
 
         # Write multiline content
@@ -52,9 +52,9 @@ with some special characters: !@#$%^&*()"""
         content = storage.read()
         assert content == test_content
 
-    def test_clear(self, tmp_path):
+    def test_clear(self, shared_file):
         """Test clearing content."""
-        test_file = tmp_path / "test.txt"
+        test_file = shared_file("test.txt")
         storage = PaneStorage(test_file)
 
         # Write and clear
@@ -66,9 +66,9 @@ with some special characters: !@#$%^&*()"""
         content = storage.read()
         assert content == ""
 
-    def test_unicode_content(self, tmp_path):
+    def test_unicode_content(self, shared_file):
         """Test handling unicode content."""
-        test_file = tmp_path / "test.txt"
+        test_file = shared_file("test.txt")
         storage = PaneStorage(test_file)
 
         # Write unicode content
@@ -79,15 +79,32 @@ with some special characters: !@#$%^&*()"""
         content = storage.read()
         assert content == test_content
 
+    def test_external_change(self, shared_file):
+        """Test that changes made to the file outside the storage are read."""
+        test_file = shared_file("test.txt")
+        storage = PaneStorage(test_file)
+        storage.write("Old content")
+
+        test_file.write_text("Edited elsewhere", encoding="utf-8")
+        assert storage.read() == "Edited elsewhere"
+
+    def test_large_content(self, shared_file):
+        """Test that large content read through a memory map round-trips."""
+        test_file = shared_file("large.txt")
+        PaneStorage(test_file).write("Line ✓\n" * 20000)
+
+        # A fresh storage reads the file back from disk
+        assert PaneStorage(test_file).read() == "Line ✓\n" * 20000
+
 
 class TestPaneManager:
     """Test PaneManager class."""
 
-    def test_create_pane_manager(self, tmp_path):
+    def test_create_pane_manager(self, shared_file):
         """Test creating a pane manager."""
-        user_file = tmp_path / "user.txt"
-        system_file = tmp_path / "system.txt"
-        context_file = tmp_path / "context.txt"
+        user_file = shared_file("user.txt")
+        system_file = shared_file("system.txt")
+        context_file = shared_file("context.txt")
 
         manager = PaneManager(user_file, system_file, context_file)
 
@@ -96,11 +113,11 @@ class TestPaneManager:
         assert manager.system_prompt is not None
         assert manager.context is not None
 
-    def test_get_pane_by_name(self, tmp_path):
+    def test_get_pane_by_name(self, shared_file):
         """Test getting panes by name."""
-        user_file = tmp_path / "user.txt"
-        system_file = tmp_path / "system.txt"
-        context_file = tmp_path / "context.txt"
+        user_file = shared_file("user.txt")
+        system_file = shared_file("system.txt")
+        context_file = shared_file("context.txt")
 
         manager = PaneManager(user_file, system_file, context_file)
 
@@ -110,11 +127,11 @@ class TestPaneManager:
         assert manager.get_pane("context") is manager.context
         assert manager.get_pane("invalid") is None
 
-    def test_pane_independence(self, tmp_path):
+    def test_pane_independence(self, shared_file):
         """Test that panes are independent."""
-        user_file = tmp_path / "user.txt"
-        system_file = tmp_path / "system.txt"
-        context_file = tmp_path / "context.txt"
+        user_file = shared_file("user.txt")
+        system_file = shared_file("system.txt")
+        context_file = shared_file("context.txt")
 
         manager = PaneManager(user_file, system_file, context_file)
 
@@ -0,0 +1,44 @@
+"""Tests for the prompt manager screen."""
+
+import os
+
+import pytest
+
+from llm_manager.gui.prompt_manager_screen import PromptManagerScreen
+
+
+@pytest.fixture
+def screen(tmp_path):
+    """Create a prompt manager screen reading prompts from a temporary directory."""
+    screen = PromptManagerScreen(pane_name="User Prompt", current_content="")
+    screen.prompts_dir = tmp_path
+    return screen
+
+
+class TestPromptScan:
+    """Test scanning the prompts directory."""
+
+    def test_scan_lists_txt_files(self, screen, tmp_path):
+        """Test that only .txt files are listed, sorted by name."""
+        (tmp_path / "b.txt").write_text("Second")
+        (tmp_path / "a.txt").write_text("First")
+        (tmp_path / "notes.md").write_text("Ignored")
+
+        assert [entry[0] for entry in screen._scan_prompts()] == ["a.txt", "b.txt"]
+
+    def test_scan_sees_in_place_edits(self, screen, tmp_path):
+        """Test that editing a prompt in place is picked up by the next scan."""
+        prompt = tmp_path / "a.txt"
+        prompt.write_text("Hello")
+        _, size, mtime_ns, _ = screen._scan_prompts()[0]
+
+        prompt.write_text("Howdy there")
+        os.utime(prompt, ns=(mtime_ns + 1, mtime_ns + 1))
+
+        _, new_size, new_mtime_ns, _ = screen._scan_prompts()[0]
+        assert (new_size, new_mtime_ns) == (len("Howdy there"), mtime_ns + 1)
+        assert (new_size, new_mtime_ns) != (size, mtime_ns)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])